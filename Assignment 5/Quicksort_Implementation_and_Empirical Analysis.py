@@ -1,10 +1,15 @@
-import time
+import argparse
 import random
 import copy
+import os
 import sys
+import numpy as np
 
-# Set recursion limit high for large test cases
-sys.setrecursionlimit(2000)
+# The shared sorting engines live in the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from sorting import SortStats, introsort, partial_sort, quickselect, quicksort_3way, top_k
+from sorting.vectorized import radix_sort, vectorized_quicksort
+from benchmark import Suite, make_datasets, time_call
 
 # --- 1. DETERMINISTIC QUICKSORT IMPLEMENTATION ---
 
@@ -31,13 +36,23 @@ def quicksort(arr, low, high):
     """
     Main deterministic Quicksort function.
     """
-    if low < high:
-        # pi is the partitioning index, arr[pi] is now in the correct position
-        pi = partition(arr, low, high)
+    # Explicit stack instead of recursion, so sorted input (depth n with a
+    # last-element pivot) is slow but no longer hits the recursion limit.
+    # The larger side is pushed and the smaller one sorted first.
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+        while low < high:
+            # pi is the partitioning index, arr[pi] is now in the correct position
+            pi = partition(arr, low, high)
 
-        # Separately sort elements before partition and after partition
-        quicksort(arr, low, pi - 1)
-        quicksort(arr, pi + 1, high)
+            # Separately sort elements before partition and after partition
+            if pi - low < high - pi:
+                stack.append((pi + 1, high))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1))
+                low = pi + 1
 
 # --- 3. RANDOMIZED QUICKSORT IMPLEMENTATION ---
 
@@ -59,86 +74,203 @@ def randomized_quicksort(arr, low, high):
     """
     Main randomized Quicksort function.
     """
-    if low < high:
-        # pi is the partitioning index, arr[pi] is now in the correct position
-        pi = randomized_partition(arr, low, high)
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+        while low < high:
+            # pi is the partitioning index, arr[pi] is now in the correct position
+            pi = randomized_partition(arr, low, high)
 
-        # Recursively sort sub-arrays
-        randomized_quicksort(arr, low, pi - 1)
-        randomized_quicksort(arr, pi + 1, high)
+            # Sort the smaller sub-array first, defer the larger one
+            if pi - low < high - pi:
+                stack.append((pi + 1, high))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1))
+                low = pi + 1
+
+# --- 3b. INSTRUMENTED VARIANTS (opt-in, for operation counts) ---
+
+def counted_partition(arr, low, high, stats):
+    """
+    partition() plus counters. The Lomuto loop compares every element with
+    the pivot once and swaps once per element <= pivot, plus the final pivot
+    swap, so the counts follow from the returned index and the loop itself
+    stays uninstrumented.
+    """
+    pi = partition(arr, low, high)
+    stats.comparisons += high - low
+    stats.swaps += pi - low + 1
+    stats.record_partition(pi - low, high - pi)
+    return pi
+
+def counted_randomized_partition(arr, low, high, stats):
+    """randomized_partition() plus counters (the pivot swap counts as one swap)."""
+    random_idx = random.randint(low, high)
+    arr[random_idx], arr[high] = arr[high], arr[random_idx]
+    stats.swaps += 1
+    return counted_partition(arr, low, high, stats)
+
+def _counted_quicksort(arr, low, high, stats, partition_func):
+    # Each segment carries its depth in the partition tree, i.e. the
+    # recursion depth a recursive quicksort would reach (n on sorted input
+    # with a last-element pivot, even though this stack stays shallow)
+    stack = [(low, high, 1)]
+    while stack:
+        low, high, depth = stack.pop()
+        while low < high:
+            stats.record_depth(depth)
+            pi = partition_func(arr, low, high, stats)
+            depth += 1
+            if pi - low < high - pi:
+                stack.append((pi + 1, high, depth))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1, depth))
+                low = pi + 1
+
+def counted_quicksort(arr, low, high, stats):
+    """quicksort() that fills in a SortStats."""
+    _counted_quicksort(arr, low, high, stats, counted_partition)
+
+def counted_randomized_quicksort(arr, low, high, stats):
+    """randomized_quicksort() that fills in a SortStats."""
+    _counted_quicksort(arr, low, high, stats, counted_randomized_partition)
 
 # --- 4. EMPIRICAL ANALYSIS FUNCTIONS ---
 
-def generate_test_arrays(n):
-    """Generates test arrays for empirical analysis."""
-    # Random Array
-    random_array = [random.randint(0, n) for _ in range(n)]
+def generate_test_arrays(n, seed=532):
+    """Generates seeded test arrays for empirical analysis."""
+    # Random, already sorted and reverse sorted (worst cases for deterministic
+    # QS) and low-cardinality (~300 distinct keys, like real production data)
+    return make_datasets(n, seed, ["Random Data", "Sorted Data", "Reverse Sorted Data", "Few Unique Data"])
 
-    # Already Sorted Array (Worst Case for Deterministic)
-    sorted_array = list(range(n))
+# Each run sorts a fresh list copy (a flat list of ints needs no deepcopy),
+# timed with perf_counter_ns with the garbage collector off
+ALGORITHMS = {
+    "Deterministic QS": (quicksort, list),
+    "Randomized QS": (randomized_quicksort, list),
+    "Introsort": (introsort, list),
+    "3-Way QS": (quicksort_3way, list),
+    # NumPy backends on a typed int64 copy
+    "NumPy QS": (vectorized_quicksort, lambda arr: np.array(arr, dtype=np.int64)),
+    "Radix": (radix_sort, lambda arr: np.array(arr, dtype=np.int64)),
+}
 
-    # Reverse Sorted Array (Also Worst Case for Deterministic)
-    reverse_sorted_array = list(range(n, 0, -1))
+# Instrumented counterparts, run once per case outside the timed runs
+COUNTED = {
+    "Deterministic QS": counted_quicksort,
+    "Randomized QS": counted_randomized_quicksort,
+}
 
-    return {
-        "Random Data": random_array,
-        "Sorted Data": sorted_array,
-        "Reverse Sorted Data": reverse_sorted_array
-    }
+def measure_time(name, arr_original, suite, case):
+    """Runs the named algorithm on copies of arr_original through the suite; returns the mean in ms."""
+    sort_func, make_copy = ALGORITHMS[name]
+    result = suite.run(case, lambda arr: sort_func(arr, 0, len(arr) - 1), lambda: make_copy(arr_original))
+    return result["mean_ns"] / 1e6
 
-def measure_time(sort_func, arr_original):
-    """Measures the running time of a sorting function on a copy of the array."""
-    # Create a deep copy to ensure the original array is not modified across tests
-    arr = copy.deepcopy(arr_original)
-    
-    start_time = time.time()
-    
-    # Call the sorting function
-    sort_func(arr, 0, len(arr) - 1)
-    
-    end_time = time.time()
-    
-    return (end_time - start_time) * 1000 # Return time in milliseconds (ms)
+def count_operations(name, arr_original):
+    """Runs the instrumented variant of the named algorithm once; returns its SortStats."""
+    stats = SortStats()
+    arr = list(arr_original)
+    COUNTED[name](arr, 0, len(arr) - 1, stats)
+    return stats
 
-def run_empirical_analysis(sizes, num_trials=3):
+def run_empirical_analysis(sizes, num_trials=3, suite=None, seed=532):
     """
     Runs and prints the empirical time comparison between deterministic and randomized Quicksort.
     """
+    # No warm-up run: deterministic QS on sorted input is quadratic
+    suite = suite if suite is not None else Suite("quicksort", repeats=num_trials, warmup=0, memory=False)
     print("\n--- Empirical Performance Comparison (Time in milliseconds) ---")
-    print(f"| Input Size (n) | Data Type | Deterministic QS (avg) | Randomized QS (avg) |")
-    print(f"|----------------|-----------|------------------------|---------------------|")
+    print(f"| Input Size (n) | Data Type | Deterministic QS (avg) | Randomized QS (avg) | Introsort (avg) | 3-Way QS (avg) | NumPy QS (avg) | Radix (avg) |")
+    print(f"|----------------|-----------|------------------------|---------------------|-----------------|----------------|----------------|-------------|")
 
+    count_rows = []
     for n in sizes:
         # Generate the test arrays for this size
-        test_arrays = generate_test_arrays(n)
+        test_arrays = generate_test_arrays(n, seed)
 
         for data_type, original_arr in test_arrays.items():
-            
-            # --- Measure Deterministic Quicksort ---
-            det_times = []
-            for _ in range(num_trials):
-                det_times.append(measure_time(quicksort, original_arr))
-            det_avg = sum(det_times) / num_trials
-
-            # --- Measure Randomized Quicksort ---
-            rand_times = []
-            for _ in range(num_trials):
-                rand_times.append(measure_time(randomized_quicksort, original_arr))
-            rand_avg = sum(rand_times) / num_trials
+            avg = {name: measure_time(name, original_arr, suite, f"{data_type}/{name}/{n}")
+                   for name in ALGORITHMS}
+            for name in COUNTED:
+                stats = count_operations(name, original_arr)
+                suite.results[f"{data_type}/{name}/{n}"].update(stats.as_dict())
+                count_rows.append((n, data_type, name, avg[name], stats))
 
             # Print results for the current size and data type
-            print(f"| {n:<14} | {data_type:<9} | {det_avg:>20.4f} | {rand_avg:>17.4f} |")
+            print(f"| {n:<14} | {data_type:<9} | {avg['Deterministic QS']:>20.4f} | {avg['Randomized QS']:>17.4f} | {avg['Introsort']:>15.4f} | {avg['3-Way QS']:>14.4f} | {avg['NumPy QS']:>14.4f} | {avg['Radix']:>11.4f} |")
+
+    # Operation counts from the instrumented variants, next to wall time
+    print("\n--- Operation Counts (instrumented runs) ---")
+    print(f"| Input Size (n) | Data Type | Algorithm | Time (ms) | Comparisons | Swaps | Max Depth | Splits < 5/95 |")
+    print(f"|----------------|-----------|-----------|-----------|-------------|-------|-----------|---------------|")
+    for n, data_type, name, avg_ms, stats in count_rows:
+        print(f"| {n:<14} | {data_type:<9} | {name:<9} | {avg_ms:>9.2f} | {stats.comparisons:>11,} | "
+              f"{stats.swaps:>5,} | {stats.max_depth:>9} | {stats.degenerate_share():>13.1%} |")
+    return suite
+
+def run_selection_analysis(n=200000, ks=(10, 100, 1000)):
+    """
+    Compares selection against a full sort when only the k smallest items
+    (or the k-th one) are needed, with k much smaller than n.
+    """
+    data = make_datasets(n, names=["Random Data"])["Random Data"]
+
+    def timed(func):
+        return time_call(func, repeats=1, warmup=0)[0] / 1e6
+
+    print(f"\n--- Selection vs Full Sort (n={n}, time in milliseconds) ---")
+    print(f"| k      | Introsort (full) | quickselect | partial_sort | top_k (stream) |")
+    print(f"|--------|------------------|-------------|--------------|----------------|")
+    for k in ks:
+        full_ms = timed(lambda: introsort(data[:], 0, n - 1))
+        select_ms = timed(lambda: quickselect(data[:], k))
+        partial_ms = timed(lambda: partial_sort(data[:], k))
+        # top_k reads from a generator, so the input is never held as a list
+        stream_ms = timed(lambda: top_k((x for x in data), k))
+        print(f"| {k:<6} | {full_ms:>16.2f} | {select_ms:>11.2f} | {partial_ms:>12.2f} | {stream_ms:>14.2f} |")
+
+def run_radix_dtype_test():
+    """
+    Radix sort on every integer dtype with keys at the dtype's min and max,
+    through both the counting path (small span) and the LSD digit passes.
+    """
+    for dtype in (np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64):
+        info = np.iinfo(dtype)
+        cases = [
+            [info.max, info.min, info.max, info.min, info.min + 1, info.max - 1],
+            [info.max, info.max - 2, info.max - 1] * 100,
+            [info.min + 3, info.min] * 100,
+        ]
+        for keys in cases:
+            arr = np.array(keys, dtype=dtype)
+            expected = np.sort(arr)
+            radix_sort(arr)
+            assert np.array_equal(arr, expected), f"radix_sort failed for {np.dtype(dtype).name}"
+    print("Radix dtype test passed: int8..uint64 at their min and max")
 
 # --- MAIN EXECUTION BLOCK ---
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Quicksort empirical analysis")
+    parser.add_argument("--output", type=str, help="write results as JSON (or CSV if *.csv)")
+    parser.add_argument("--compare", type=str, help="baseline JSON to check for regressions")
+    args = parser.parse_args()
+
     # Define input sizes to test. Start smaller, scale up to demonstrate O(n^2) vs O(n log n)
     # Note: For sorted/reverse-sorted data, deterministic QS will be very fast for small n, 
     # but the time difference will dramatically increase as n grows.
     test_sizes = [5000, 10000, 20000, 40000]
 
     # Run the analysis
-    run_empirical_analysis(test_sizes)
+    suite = run_empirical_analysis(test_sizes)
+    if args.output:
+        suite.save(args.output)
+    if args.compare:
+        suite.compare(args.compare)
+    run_selection_analysis()
 
     # Example of a quick test to ensure correctness
     print("\n--- Correctness Test (n=10) ---")
@@ -150,3 +282,5 @@ if __name__ == "__main__":
 
     randomized_quicksort(test_arr_rand, 0, len(test_arr_rand) - 1)
     print(f"Randomized QS Result: {test_arr_rand}")
+
+    run_radix_dtype_test()
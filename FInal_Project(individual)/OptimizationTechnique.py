@@ -2,22 +2,35 @@
 # Optimization Technique and Implementation
 # Oct 25, 2025
 
+import math
+import os
+import sys
+import tempfile
 import numpy as np
-import timeit
 from collections import namedtuple
 
+# The shared benchmark harness lives in the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from benchmark import Suite, measure
+from ParticleStore import ParticleStore, generate_chunks
+from ParticleDataset import ParticleDataset, generate_dataset
+from ParallelReduce import BLOCK_SIZE, ParallelReducer
+from SpatialIndex import GridIndex, brute_count_box, brute_knn, brute_radius
+
 # --- Data Size ---
 N = 10**6  # 1 million particles
+SEED = 532
+
+# The data is drawn once, in bulk, straight into SOA columns; the AOS list
+# below is derived from the same values so both layouts hold identical data
+particles_soa = ParticleStore.random(N, SEED)
 
 # --- 1. UNOPTIMIZED: Array of Structures (AOS) ---
 # Use a namedtuple to simulate a standard Python object/struct
 Particle = namedtuple('Particle', ['x', 'y', 'z'])
 
-# Create a list of 1 million Python objects
-particles_aos = [
-    Particle(x=np.random.rand(), y=np.random.rand(), z=np.random.rand())
-    for _ in range(N)
-]
+# Create a list of 1 million Python objects (records -> tuples -> Particles)
+particles_aos = list(map(Particle._make, particles_soa.to_records().tolist()))
 
 def process_aos(data):
     """
@@ -30,11 +43,53 @@ def process_aos(data):
         total_x += p.x
     return total_x
 
+# --- AOS baselines for the ParticleStore kernels (per-object Python loops) ---
+
+def centroid_aos(data):
+    sx = sy = sz = 0.0
+    for p in data:
+        sx += p.x
+        sy += p.y
+        sz += p.z
+    return (sx / len(data), sy / len(data), sz / len(data))
+
+def bounding_box_aos(data):
+    first = data[0]
+    lo = [first.x, first.y, first.z]
+    hi = list(lo)
+    for p in data:
+        for axis, value in enumerate(p):
+            if value < lo[axis]:
+                lo[axis] = value
+            elif value > hi[axis]:
+                hi[axis] = value
+    return lo, hi
+
+def axis_stats_aos(data):
+    stats = {}
+    for axis, name in enumerate(Particle._fields):
+        values = [p[axis] for p in data]
+        mean = sum(values) / len(values)
+        stats[name] = {"min": min(values), "max": max(values),
+                       "var": sum((v - mean) ** 2 for v in values) / len(values)}
+    return stats
+
+def distance_to_aos(data, point):
+    px, py, pz = point
+    return [((p.x - px) ** 2 + (p.y - py) ** 2 + (p.z - pz) ** 2) ** 0.5 for p in data]
+
+def where_aos(data, predicate):
+    return [i for i, p in enumerate(data) if predicate(p.x, p.y, p.z)]
+
+def translate_aos(data, dx, dy, dz):
+    # namedtuples are immutable, so AOS code rebuilds every object
+    return [Particle(p.x + dx, p.y + dy, p.z + dz) for p in data]
+
+def scale_aos(data, factor):
+    return [Particle(p.x * factor, p.y * factor, p.z * factor) for p in data]
+
 # --- 2. OPTIMIZED: Structure of Arrays (SOA) ---
-# Use separate, contiguous NumPy arrays for each field
-particles_soa_x = np.array([p.x for p in particles_aos], dtype=np.float64)
-particles_soa_y = np.array([p.y for p in particles_aos], dtype=np.float64)
-particles_soa_z = np.array([p.z for p in particles_aos], dtype=np.float64)
+# Separate, contiguous NumPy arrays for each field, owned by particles_soa
 
 def process_soa(data_x):
     """
@@ -46,14 +101,200 @@ def process_soa(data_x):
     return np.sum(data_x)
 
 # --- Performance Measurement ---
-# Number of runs to average
-runs = 5
+POINT = (0.5, 0.5, 0.5)
+
+# kernel name -> (AOS baseline, SOA kernel), both called with no arguments
+KERNELS = {
+    "sum_x": (lambda: process_aos(particles_aos), lambda: process_soa(particles_soa.x)),
+    "centroid": (lambda: centroid_aos(particles_aos), particles_soa.centroid),
+    "bounding_box": (lambda: bounding_box_aos(particles_aos), particles_soa.bounding_box),
+    "axis_stats": (lambda: axis_stats_aos(particles_aos), particles_soa.axis_stats),
+    "distance_to": (lambda: distance_to_aos(particles_aos, POINT),
+                    lambda: particles_soa.distance_to(POINT)),
+    "where": (lambda: where_aos(particles_aos, lambda x, y, z: x < 0.1 and z > 0.9),
+              lambda: particles_soa.where(lambda x, y, z: (x < 0.1) & (z > 0.9))),
+    "translate": (lambda: translate_aos(particles_aos, 0.0, 0.0, 0.0),
+                  lambda: particles_soa.translate(0.0, 0.0, 0.0)),
+    "scale": (lambda: scale_aos(particles_aos, 1.0), lambda: particles_soa.scale(1.0)),
+}
+
+def check_kernels():
+    """The SOA kernels must agree with their AOS baselines."""
+    assert np.isclose(process_aos(particles_aos), process_soa(particles_soa.x))
+    assert np.allclose(centroid_aos(particles_aos), particles_soa.centroid())
+    assert np.allclose(bounding_box_aos(particles_aos), particles_soa.bounding_box())
+    aos_stats, soa_stats = axis_stats_aos(particles_aos), particles_soa.axis_stats()
+    for axis in Particle._fields:
+        for key in ("min", "max", "var"):
+            assert np.isclose(aos_stats[axis][key], soa_stats[axis][key])
+    assert np.allclose(distance_to_aos(particles_aos, POINT), particles_soa.distance_to(POINT))
+    assert (where_aos(particles_aos, lambda x, y, z: x < 0.1 and z > 0.9)
+            == particles_soa.where(lambda x, y, z: (x < 0.1) & (z > 0.9)).tolist())
+
+# --- Data Generation ---
+GENERATION_SIZES = [10**6, 10**7, 10**8]
+LEGACY_LIMIT = 10**6       # the per-element path is only run up to here
+IN_MEMORY_LIMIT = 10**7    # larger N is only generated in chunks
+
+def generate_legacy(n):
+    """The original path: 3n scalar draws into namedtuples, then copies into NumPy."""
+    aos = [Particle(x=np.random.rand(), y=np.random.rand(), z=np.random.rand())
+           for _ in range(n)]
+    return (np.array([p.x for p in aos], dtype=np.float64),
+            np.array([p.y for p in aos], dtype=np.float64),
+            np.array([p.z for p in aos], dtype=np.float64))
+
+def generate_chunked_sum(n):
+    """Generate n particles chunk by chunk, keeping only a running sum of x."""
+    return sum(process_soa(chunk.x) for chunk in generate_chunks(n, SEED))
+
+def run_generation_benchmark(sizes, suite):
+    print("\n--- Particle Generation ---")
+    print(f"| {'N':>11} | {'Method':<22} | {'Time (s)':>9} | {'Peak (MB)':>10} |")
+    print(f"|{'-' * 13}|{'-' * 24}|{'-' * 11}|{'-' * 12}|")
+    for n in sizes:
+        methods = {"chunked SOA (streamed)": lambda: generate_chunked_sum(n)}
+        if n <= IN_MEMORY_LIMIT:
+            methods["bulk SOA"] = lambda: ParticleStore.random(n, SEED)
+        if n <= LEGACY_LIMIT:
+            methods["per-element AOS -> SOA"] = lambda: generate_legacy(n)
+        for method, func in methods.items():
+            result = suite.record(f"generate/{method}/{n}", measure(func, repeats=1, warmup=0))
+            print(f"| {n:>11,} | {method:<22} | {result['mean_ns'] / 1e9:>9.3f} | "
+                  f"{result['peak_bytes'] / (1024 * 1024):>10.1f} |")
+
+# --- On-Disk Datasets ---
+DATASET_SIZES = [N, 10**7]
+# Generated datasets are kept here and reused by later runs
+DATA_DIR = os.environ.get("PARTICLE_DATA_DIR", os.path.join(tempfile.gettempdir(), "particles"))
+
+def open_dataset(n, seed=SEED):
+    """Open the cached dataset for (n, seed), generating it on first use."""
+    directory = os.path.join(DATA_DIR, f"n{n}-seed{seed}")
+    try:
+        return ParticleDataset(directory)
+    except (OSError, ValueError):
+        return generate_dataset(directory, n, seed)
+
+def run_dataset_benchmark(sizes, suite):
+    print("\n--- Memory-Mapped Datasets (streamed in chunks) ---")
+    print(f"| {'N':>11} | {'Open (ms)':>9} | {'sum_x (s)':>9} | {'centroid (s)':>12} | {'Peak (MB)':>9} | Match |")
+    print(f"|{'-' * 13}|{'-' * 11}|{'-' * 11}|{'-' * 14}|{'-' * 11}|{'-' * 7}|")
+    for n in sizes:
+        dataset = open_dataset(n)
+        opened = suite.run(f"dataset/open/{n}", lambda: ParticleDataset(dataset.directory),
+                           repeats=5, memory=False)
+        summed = suite.run(f"dataset/sum_x/{n}", dataset.sum, repeats=3, memory=True)
+        centroid = suite.run(f"dataset/centroid/{n}", dataset.centroid, repeats=3, memory=False)
+        # The streamed results must match the in-memory kernels on the same data
+        store = particles_soa if n == N else ParticleStore.random(n, SEED)
+        match = (np.isclose(dataset.sum(), process_soa(store.x))
+                 and np.allclose(dataset.centroid(), store.centroid()))
+        print(f"| {n:>11,} | {opened['mean_ns'] / 1e6:>9.3f} | {summed['mean_ns'] / 1e9:>9.3f} | "
+              f"{centroid['mean_ns'] / 1e9:>12.3f} | {summed['peak_bytes'] / (1024 * 1024):>9.1f} | "
+              f"{'yes' if match else 'NO':>5} |")
+
+# --- Parallel Reductions ---
+SCALING_SIZE = 10**8  # one 800 MB column
+
+def run_scaling_benchmark(n, suite):
+    column = np.random.default_rng(SEED).random(n)
+    cores = os.cpu_count() or 1
+    thread_counts = sorted({1, 2, 4, 8, 16, 32, 64, cores} & set(range(1, cores + 1)))
+    print(f"\n--- Parallel sum_x over N={n:,} ({column.nbytes / 1e9:.1f} GB, up to {cores} cores) ---")
+    print(f"| {'Threads':>7} | {'Time (s)':>9} | {'GB/s':>6} | {'Speedup':>8} |")
+    print(f"|{'-' * 9}|{'-' * 11}|{'-' * 8}|{'-' * 10}|")
+    baseline = None
+    for threads in thread_counts:
+        with ParallelReducer(threads) as reducer:
+            elapsed = suite.run(f"parallel_sum/{threads}/{n}", lambda: reducer.sum(column),
+                                repeats=3, memory=False)["mean_ns"] / 1e9
+        baseline = baseline or elapsed
+        print(f"| {threads:>7} | {elapsed:>9.4f} | {column.nbytes / 1e9 / elapsed:>6.2f} | {baseline / elapsed:>7.2f}X |")
+
+    # Accuracy against the exactly rounded sum. Both references stream over
+    # blocks: fsum reads Python floats a block at a time (not NumPy scalars),
+    # and the running total carries its last value from block to block, so
+    # neither allocates a second N-sized array.
+    blocks = range(0, n, BLOCK_SIZE)
+    exact = math.fsum(x for lo in blocks for x in column[lo:lo + BLOCK_SIZE].tolist())
+    running = np.empty(min(BLOCK_SIZE, n))
+    carry = 0.0
+    for lo in blocks:
+        block = running[:min(BLOCK_SIZE, n - lo)]
+        block[:] = column[lo:lo + len(block)]
+        block[0] += carry
+        np.cumsum(block, out=block)  # strictly sequential, like a Python loop
+        carry = float(block[-1])
+    with ParallelReducer(thread_counts[-1]) as reducer:
+        errors = {
+            "running total": carry - exact,
+            "np.sum (pairwise)": float(np.sum(column)) - exact,
+            "blocks + Kahan": reducer.sum(column) - exact,
+        }
+    for method, error in errors.items():
+        print(f"  {method:<18} error vs math.fsum: {error:+.3e}")
+
+# --- Spatial Index ---
+SPATIAL_SIZES = [10**5, 10**6, 10**7]
+QUERIES = 1000        # batch size for the grid queries
+BRUTE_QUERIES = 20    # brute force is O(N) per query, so fewer are timed
+NEIGHBORS = 32        # radius is chosen so a ball holds about this many particles
+
+def run_spatial_benchmark(sizes, suite):
+    print("\n--- Spatial Index vs Brute Force ---")
+    print(f"| {'N':>11} | {'Build (s)':>9} | {'Query':<13} | {'Grid q/s':>10} | {'Brute q/s':>9} | {'Speedup':>8} |")
+    print(f"|{'-' * 13}|{'-' * 11}|{'-' * 15}|{'-' * 12}|{'-' * 11}|{'-' * 10}|")
+    rng = np.random.default_rng(SEED)
+    for n in sizes:
+        store = particles_soa if n == N else ParticleStore.random(n, SEED)
+        built = suite.run(f"spatial/build/{n}", lambda: GridIndex(store), repeats=1, warmup=0, memory=False)
+        index = GridIndex(store)
+        points = rng.random((QUERIES, 3))
+        radius = (NEIGHBORS * 3 / (4 * math.pi * n)) ** (1 / 3)
+        lows, highs = points - radius, points + radius
+
+        # Spot-check the grid answers against brute force
+        assert sorted(index.query_radius(points[0], radius)) == sorted(brute_radius(store, points[0], radius))
+        assert index.count_box(lows[0], highs[0]) == brute_count_box(store, lows[0], highs[0])
+        assert np.allclose(index.knn(points[0], 8)[0], brute_knn(store, points[0], 8)[0])
+
+        cases = {
+            "radius": (lambda: index.query_radius(points, radius),
+                       lambda: [brute_radius(store, p, radius) for p in points[:BRUTE_QUERIES]]),
+            "kNN (k=8)": (lambda: index.knn(points, 8),
+                          lambda: [brute_knn(store, p, 8) for p in points[:BRUTE_QUERIES]]),
+            "box count": (lambda: index.count_box(lows, highs),
+                          lambda: [brute_count_box(store, lo, hi)
+                                   for lo, hi in zip(lows[:BRUTE_QUERIES], highs[:BRUTE_QUERIES])]),
+        }
+        for i, (query, (grid_func, brute_func)) in enumerate(cases.items()):
+            grid = suite.run(f"spatial/{query}/grid/{n}", grid_func, repeats=3, memory=False)
+            brute = suite.run(f"spatial/{query}/brute/{n}", brute_func, repeats=1, memory=False)
+            grid_qps = QUERIES / (grid["mean_ns"] / 1e9)
+            brute_qps = BRUTE_QUERIES / (brute["mean_ns"] / 1e9)
+            build = f"{built['mean_ns'] / 1e9:>9.3f}" if i == 0 else " " * 9
+            print(f"| {n:>11,} | {build} | {query:<13} | {grid_qps:>10,.0f} | {brute_qps:>9,.0f} | "
+                  f"{grid_qps / brute_qps:>7.0f}X |")
+
+if __name__ == "__main__":
+    # Number of timed runs (after one warm-up), GC disabled while timing
+    runs = 5
+    suite = Suite("particles", repeats=runs, memory=False)
+    check_kernels()
 
-time_aos = timeit.timeit(lambda: process_aos(particles_aos), number=runs) / runs
-time_soa = timeit.timeit(lambda: process_soa(particles_soa_x), number=runs) / runs
+    # --- Results ---
+    print(f"--- Data Processing for N={N} Particles (average of {runs} runs) ---")
+    print(f"| {'Kernel':<13} | {'AOS (s)':>10} | {'SOA (s)':>10} | {'Speedup':>8} |")
+    print(f"|{'-' * 15}|{'-' * 12}|{'-' * 12}|{'-' * 10}|")
+    for kernel, (aos_func, soa_func) in KERNELS.items():
+        time_aos = suite.run(f"{kernel}/AOS", aos_func)["mean_ns"] / 1e9
+        time_soa = suite.run(f"{kernel}/SOA", soa_func)["mean_ns"] / 1e9
+        print(f"| {kernel:<13} | {time_aos:>10.6f} | {time_soa:>10.6f} | {time_aos / time_soa:>7.1f}X |")
 
-# --- Results ---
-print(f"--- Data Processing for N={N} Particles ---")
-print(f"1. AOS (Pure Python): {time_aos:.6f} seconds (Average of {runs} runs)")
-print(f"2. SOA (NumPy Optimized): {time_soa:.6f} seconds (Average of {runs} runs)")
-print(f"Observed Speedup: {time_aos / time_soa:.2f}X")
\ No newline at end of file
+    run_generation_benchmark(GENERATION_SIZES, suite)
+    run_dataset_benchmark(DATASET_SIZES, suite)
+    run_scaling_benchmark(SCALING_SIZE, suite)
+    run_spatial_benchmark(SPATIAL_SIZES, suite)
+    if len(sys.argv) > 1:
+        suite.save(sys.argv[1])  # e.g. results.json or results.csv
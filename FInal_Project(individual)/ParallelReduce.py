@@ -0,0 +1,112 @@
+# Bereket Gebremariam
+# Multi-threaded block reductions over ParticleStore columns
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from ParticleStore import AXES
+
+# 64K float64 = 512 KB per block, small enough to stay in a core's L2 cache
+BLOCK_SIZE = 1 << 16
+
+def compensated_sum(values):
+    """
+    Kahan-Babuska (Neumaier) summation of an iterable of floats. Used to
+    combine per-block partial sums; each partial is already a pairwise sum
+    (np.sum), so the total error stays near one rounding instead of growing
+    with N as a running total does.
+    """
+    total = 0.0
+    compensation = 0.0
+    for value in values:
+        t = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - t) + value
+        else:
+            compensation += (value - t) + total
+        total = t
+    return total + compensation
+
+
+class ParallelReducer:
+    """
+    Splits columns into cache-sized blocks and reduces them on a thread pool.
+    NumPy releases the GIL inside each block's reduction, so the threads run
+    on separate cores; Python only runs once per block. Every worker gets
+    one contiguous stripe of blocks (sequential memory access, one task per
+    worker) and the ordered block partials are combined with compensation,
+    so results do not depend on the number of workers.
+    """
+
+    def __init__(self, workers=None, block_size=BLOCK_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self._executor = ThreadPoolExecutor(self.workers) if self.workers > 1 else None
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def map_blocks(self, n, kernel):
+        """kernel(start, stop) for every block of range(n), in block order."""
+        starts = range(0, n, self.block_size)
+        if self._executor is None or len(starts) < 2:
+            return [kernel(s, min(s + self.block_size, n)) for s in starts]
+        per_stripe = -(-len(starts) // self.workers)
+
+        def stripe(first):
+            return [kernel(s, min(s + self.block_size, n)) for s in starts[first:first + per_stripe]]
+
+        stripes = self._executor.map(stripe, range(0, len(starts), per_stripe))
+        return [partial for partials in stripes for partial in partials]
+
+    # --- Kernels ---
+    # centroid, bounding_box and axis_stats have no value for zero
+    # particles, so they raise ValueError instead of returning nan.
+
+    @staticmethod
+    def _require_particles(store):
+        if len(store) == 0:
+            raise ValueError("cannot reduce an empty ParticleStore")
+
+    def sum(self, column):
+        return compensated_sum(self.map_blocks(len(column), lambda lo, hi: float(column[lo:hi].sum())))
+
+    def centroid(self, store):
+        self._require_particles(store)
+        n = len(store)
+        return np.array([self.sum(column) for column in store.columns()]) / n
+
+    def bounding_box(self, store):
+        self._require_particles(store)
+        columns = store.columns()
+        partials = self.map_blocks(len(store), lambda lo, hi: (
+            [c[lo:hi].min() for c in columns], [c[lo:hi].max() for c in columns]))
+        return (np.min([lo for lo, _ in partials], axis=0),
+                np.max([hi for _, hi in partials], axis=0))
+
+    def axis_stats(self, store):
+        """Per-axis min, max and variance; block (count, mean, M2) merged with Chan's formula."""
+        self._require_particles(store)
+        stats = {}
+        for axis, column in zip(AXES, store.columns()):
+            partials = self.map_blocks(len(column), lambda lo, hi: (
+                hi - lo, column[lo:hi].mean(), column[lo:hi].var() * (hi - lo),
+                column[lo:hi].min(), column[lo:hi].max()))
+            count, mean, m2 = 0, 0.0, 0.0
+            for n, block_mean, block_m2, _, _ in partials:
+                delta = block_mean - mean
+                total = count + n
+                mean += delta * n / total
+                m2 += block_m2 + delta * delta * count * n / total
+                count = total
+            stats[axis] = {"min": min(p[3] for p in partials),
+                           "max": max(p[4] for p in partials),
+                           "var": m2 / count}
+        return stats
@@ -0,0 +1,162 @@
+# Bereket Gebremariam
+# On-disk particle datasets: one memory-mapped file per column plus a header
+
+import json
+import os
+import numpy as np
+from ParticleStore import AXES, CHUNK_SIZE, ParticleStore, generate_chunks
+
+HEADER_NAME = "header.json"
+FORMAT = "particles-soa"
+VERSION = 1
+DTYPE = np.dtype("<f8")
+
+def _column_path(directory, axis):
+    return os.path.join(directory, f"{axis}.f64")
+
+def write_dataset(directory, chunks):
+    """
+    Write an iterable of ParticleStore chunks as a dataset and return it
+    opened. The header is written last (via a temp file and rename), so an
+    interrupted write never leaves something that opens as a valid dataset.
+    """
+    os.makedirs(directory, exist_ok=True)
+    header_path = os.path.join(directory, HEADER_NAME)
+    if os.path.exists(header_path):
+        os.remove(header_path)
+    files = [open(_column_path(directory, axis), "wb") for axis in AXES]
+    count = 0
+    try:
+        for chunk in chunks:
+            for f, column in zip(files, chunk.columns()):
+                column.astype(DTYPE, copy=False).tofile(f)
+            count += len(chunk)
+    finally:
+        for f in files:
+            f.close()
+    header = {"format": FORMAT, "version": VERSION, "count": count,
+              "dtype": DTYPE.str, "fields": list(AXES)}
+    with open(header_path + ".tmp", "w") as f:
+        json.dump(header, f)
+    os.replace(header_path + ".tmp", header_path)
+    return ParticleDataset(directory)
+
+def generate_dataset(directory, n, seed=None, chunk_size=CHUNK_SIZE):
+    """Generate n particles chunk by chunk straight to disk (same data as ParticleStore.random)."""
+    return write_dataset(directory, generate_chunks(n, seed, chunk_size))
+
+
+class ParticleDataset:
+    """
+    A persisted SOA particle dataset. Opening only reads the header and
+    checks the column file sizes, so startup cost does not depend on N;
+    as_store() memory-maps the columns for random access (mode "r" or
+    "r+"). Reductions stream over fixed-size chunks read into reused
+    buffers, so memory stays bounded by the chunk size however large the
+    dataset is.
+    """
+
+    def __init__(self, directory, mode="r"):
+        self.directory = directory
+        with open(os.path.join(directory, HEADER_NAME)) as f:
+            header = json.load(f)
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError(f"Not a particle dataset: {directory}")
+        if header["dtype"] != DTYPE.str or header["fields"] != list(AXES):
+            raise ValueError(f"Unsupported dataset layout: {directory}")
+        self.count = header["count"]
+        for axis in AXES:
+            if os.path.getsize(_column_path(directory, axis)) != self.count * DTYPE.itemsize:
+                raise ValueError(f"Column {axis} does not match the header: {directory}")
+        self.mode = mode
+
+    def __len__(self):
+        return self.count
+
+    def as_store(self):
+        """A ParticleStore whose columns are memory maps of the files (no copy)."""
+        if self.count == 0:
+            return ParticleStore(*(np.empty(0, DTYPE) for _ in AXES))
+        return ParticleStore(*(np.memmap(_column_path(self.directory, axis), dtype=DTYPE,
+                                         mode=self.mode, shape=(self.count,))
+                               for axis in AXES))
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Yield ParticleStores of up to chunk_size particles in file order.
+        The buffers are reused: a chunk is only valid until the next one.
+        """
+        buffers = [np.empty(min(chunk_size, self.count), DTYPE) for _ in AXES]
+        files = [open(_column_path(self.directory, axis), "rb") for axis in AXES]
+        try:
+            for start in range(0, self.count, chunk_size):
+                size = min(chunk_size, self.count - start)
+                views = [buffer[:size] for buffer in buffers]
+                for f, view in zip(files, views):
+                    f.readinto(memoryview(view).cast("B"))
+                yield ParticleStore(*views)
+        finally:
+            for f in files:
+                f.close()
+
+    def column_chunks(self, axis, chunk_size=CHUNK_SIZE):
+        """Like chunks(), but reads only one column (a reused float64 buffer per chunk)."""
+        buffer = np.empty(min(chunk_size, self.count), DTYPE)
+        with open(_column_path(self.directory, axis), "rb") as f:
+            for start in range(0, self.count, chunk_size):
+                view = buffer[:min(chunk_size, self.count - start)]
+                f.readinto(memoryview(view).cast("B"))
+                yield view
+
+    # --- Streaming reductions (same results as the in-memory kernels) ---
+    # centroid, bounding_box and axis_stats raise ValueError for an empty
+    # dataset, like ParallelReducer, instead of returning nan or inf.
+
+    def _require_particles(self):
+        if self.count == 0:
+            raise ValueError("cannot reduce an empty ParticleDataset")
+
+    def sum(self, axis="x", chunk_size=CHUNK_SIZE):
+        return sum(float(chunk.sum()) for chunk in self.column_chunks(axis, chunk_size))
+
+    def centroid(self, chunk_size=CHUNK_SIZE):
+        self._require_particles()
+        totals = np.zeros(3)
+        for chunk in self.chunks(chunk_size):
+            totals += [c.sum() for c in chunk.columns()]
+        return totals / self.count
+
+    def bounding_box(self, chunk_size=CHUNK_SIZE):
+        self._require_particles()
+        mins, maxs = np.full(3, np.inf), np.full(3, -np.inf)
+        for chunk in self.chunks(chunk_size):
+            lo, hi = chunk.bounding_box()
+            np.minimum(mins, lo, out=mins)
+            np.maximum(maxs, hi, out=maxs)
+        return mins, maxs
+
+    def axis_stats(self, chunk_size=CHUNK_SIZE):
+        """Per-axis min, max and variance; chunk variances are merged with Chan's formula."""
+        self._require_particles()
+        count = 0
+        mean, m2 = np.zeros(3), np.zeros(3)
+        mins, maxs = np.full(3, np.inf), np.full(3, -np.inf)
+        for chunk in self.chunks(chunk_size):
+            n = len(chunk)
+            columns = chunk.columns()
+            chunk_mean = np.array([c.mean() for c in columns])
+            chunk_m2 = np.array([c.var() for c in columns]) * n
+            delta = chunk_mean - mean
+            total = count + n
+            mean += delta * n / total
+            m2 += chunk_m2 + delta * delta * count * n / total
+            count = total
+            np.minimum(mins, [c.min() for c in columns], out=mins)
+            np.maximum(maxs, [c.max() for c in columns], out=maxs)
+        return {axis: {"min": mins[i], "max": maxs[i], "var": m2[i] / count}
+                for i, axis in enumerate(AXES)}
+
+    def count_where(self, predicate, chunk_size=CHUNK_SIZE):
+        """Number of particles for which predicate(x, y, z) is true (see ParticleStore.where)."""
+        return sum(int(np.count_nonzero(predicate(*chunk.columns())))
+                   for chunk in self.chunks(chunk_size))
@@ -0,0 +1,142 @@
+# Bereket Gebremariam
+# Columnar (Structure of Arrays) particle storage with vectorized kernels
+
+import numpy as np
+
+AXES = ("x", "y", "z")
+# One AOS record; an (n, 3) float64 array can be viewed as records for free
+PARTICLE_DTYPE = np.dtype([("x", np.float64), ("y", np.float64), ("z", np.float64)])
+# Particles per chunk in chunked generation (3 columns x 8 MB)
+CHUNK_SIZE = 1 << 20
+
+def _axis_generators(seed):
+    """
+    One independent Generator per axis, so each column is the same stream
+    whether it is drawn in one call or in chunks of any size.
+    """
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3)]
+
+def generate_chunks(n, seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Yield ParticleStores of up to chunk_size uniform [0, 1) particles, n in
+    total, for datasets larger than RAM. Concatenated, the chunks equal
+    ParticleStore.random(n, seed).
+    """
+    gens = _axis_generators(seed)
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        yield ParticleStore(*(g.random(size) for g in gens))
+
+class ParticleStore:
+    """
+    Owns one contiguous float64 column per coordinate (the SOA layout from
+    OptimizationTechnique.py). Every kernel works on whole columns in
+    NumPy, so no operation loops over particles in Python.
+    """
+
+    def __init__(self, x, y, z):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        self.z = np.ascontiguousarray(z, dtype=np.float64)
+        if not len(self.x) == len(self.y) == len(self.z):
+            raise ValueError("x, y and z columns must have the same length")
+
+    @classmethod
+    def random(cls, n, seed=None):
+        """n uniform [0, 1) particles drawn straight into the columns, one batched draw per axis."""
+        return cls(*(g.random(n) for g in _axis_generators(seed)))
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a store from a PARTICLE_DTYPE record array (AOS layout)."""
+        return cls(records["x"], records["y"], records["z"])
+
+    def to_records(self):
+        """The particles in AOS layout, as a PARTICLE_DTYPE record array."""
+        records = np.empty(len(self), dtype=PARTICLE_DTYPE)
+        for axis, column in zip(AXES, self.columns()):
+            records[axis] = column
+        return records
+
+    @classmethod
+    def from_aos(cls, particles):
+        """
+        Build a store from (x, y, z) records: a PARTICLE_DTYPE array, an
+        (n, 3) float array (viewed as records without copying) or a
+        sequence such as a list of Particle namedtuples.
+        """
+        if isinstance(particles, np.ndarray) and particles.dtype == PARTICLE_DTYPE:
+            return cls.from_records(particles)
+        xyz = np.ascontiguousarray(particles, dtype=np.float64).reshape(-1, 3)
+        return cls.from_records(xyz.view(PARTICLE_DTYPE).reshape(-1))
+
+    def __len__(self):
+        return len(self.x)
+
+    def columns(self):
+        return self.x, self.y, self.z
+
+    def take(self, indices):
+        """A new store holding only the particles at indices (e.g. from where())."""
+        return ParticleStore(self.x[indices], self.y[indices], self.z[indices])
+
+    # --- Reductions ---
+
+    def centroid(self):
+        return np.array([self.x.mean(), self.y.mean(), self.z.mean()])
+
+    def bounding_box(self):
+        """(mins, maxs) as two length-3 arrays."""
+        columns = self.columns()
+        return (np.array([c.min() for c in columns]),
+                np.array([c.max() for c in columns]))
+
+    def axis_stats(self):
+        """Per-axis min, max and (population) variance."""
+        return {axis: {"min": c.min(), "max": c.max(), "var": c.var()}
+                for axis, c in zip(AXES, self.columns())}
+
+    # --- Element-wise kernels ---
+
+    def distance_to(self, point):
+        """Euclidean distance of every particle to point, as a new array."""
+        px, py, pz = point
+        # Accumulate into one buffer instead of building a temporary per term
+        dist = self.x - px
+        dist *= dist
+        tmp = self.y - py
+        tmp *= tmp
+        dist += tmp
+        np.subtract(self.z, pz, out=tmp)
+        tmp *= tmp
+        dist += tmp
+        return np.sqrt(dist, out=dist)
+
+    def where(self, predicate):
+        """
+        Indices of the particles for which predicate(x, y, z) is true, where
+        predicate maps the columns to a boolean mask, e.g.
+        store.where(lambda x, y, z: (x > 0.5) & (z < 0.1)).
+        """
+        return np.flatnonzero(predicate(self.x, self.y, self.z))
+
+    def within_radius(self, point, radius):
+        """Indices of the particles within radius of point."""
+        return np.flatnonzero(self.distance_to(point) <= radius)
+
+    # --- In-place transforms ---
+
+    def translate(self, dx, dy, dz):
+        self.x += dx
+        self.y += dy
+        self.z += dz
+
+    def scale(self, factor, origin=(0.0, 0.0, 0.0)):
+        """Scale positions about origin by factor (a scalar or per-axis triple)."""
+        factors = np.broadcast_to(factor, 3)
+        for column, o, f in zip(self.columns(), origin, factors):
+            if o:
+                column -= o
+            column *= f
+            if o:
+                column += o
@@ -0,0 +1,179 @@
+# Bereket Gebremariam
+# Uniform grid (cell list) spatial index over ParticleStore positions
+
+import numpy as np
+from ParticleStore import ParticleStore
+
+# Default cell size aims for about this many particles per cell
+PER_CELL = 8
+# Upper bound on cells per axis, so cell ids always fit in an int64
+MAX_CELLS_PER_AXIS = 1 << 20
+
+class GridIndex:
+    """
+    Cell list over the x/y/z columns of a ParticleStore.
+
+    Particles are bucketed into cubic cells, and the cell ids
+    ((ix * ny + iy) * nz + iz) are sorted once, with a copy of the positions
+    in that order. All z-cells of one (ix, iy) column are then a contiguous
+    id range, so one searchsorted pair finds all of their particles. Every
+    query takes a batch of points (a single point also works) and gathers
+    candidates for the whole batch with array operations, then filters
+    them exactly. Results are indices into the original store.
+    """
+
+    def __init__(self, store, cell_size=None, per_cell=PER_CELL):
+        n = len(store)
+        if n == 0:
+            raise ValueError("cannot index an empty ParticleStore")
+        columns = store.columns()
+        self.mins = np.array([c.min() for c in columns])
+        extent = np.maximum(np.array([c.max() for c in columns]) - self.mins, 1e-12)
+        if cell_size is None:
+            # Density over the axes the data actually spans, so flat (2-D)
+            # or linear data does not get microscopic cells
+            spanned = extent[extent > extent.max() * 1e-3]
+            cell_size = (np.prod(spanned) * per_cell / n) ** (1 / len(spanned))
+        self.cell_size = float(max(cell_size, extent.max() / MAX_CELLS_PER_AXIS))
+        self.dims = (extent // self.cell_size).astype(np.int64) + 1
+
+        ix, iy, iz = (self._cell_of(c, axis) for axis, c in enumerate(columns))
+        ids = (ix * self.dims[1] + iy) * self.dims[2] + iz
+        self.order = np.argsort(ids, kind="stable")
+        self.cell_ids = ids[self.order]
+        self.sorted = ParticleStore(*(c[self.order] for c in columns))
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cell_of(self, values, axis):
+        cells = np.floor((values - self.mins[axis]) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.dims[axis] - 1)
+
+    def _candidates(self, lows, highs):
+        """
+        (query, position) pairs for every particle in the cells overlapping
+        each box lows[i]..highs[i]; positions index the sorted columns and
+        come out grouped by query.
+        """
+        if len(lows) == 0:  # empty batch: nothing to gather (and no max span)
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        lo = np.stack([self._cell_of(lows[:, a], a) for a in range(3)], axis=1)
+        hi = np.stack([self._cell_of(highs[:, a], a) for a in range(3)], axis=1)
+        span = hi - lo + 1
+        ix = lo[:, 0, None, None] + np.arange(span[:, 0].max())[None, :, None]
+        iy = lo[:, 1, None, None] + np.arange(span[:, 1].max())[None, None, :]
+        valid = (ix <= hi[:, 0, None, None]) & (iy <= hi[:, 1, None, None])
+        base = (ix * self.dims[1] + iy) * self.dims[2]
+        first = np.broadcast_to(base + lo[:, 2, None, None], valid.shape)[valid]
+        last = np.broadcast_to(base + hi[:, 2, None, None], valid.shape)[valid]
+        query = np.broadcast_to(np.arange(len(lows))[:, None, None], valid.shape)[valid]
+
+        start = np.searchsorted(self.cell_ids, first, "left")
+        lengths = np.searchsorted(self.cell_ids, last, "right") - start
+        # Expand the [start, start + length) ranges into one flat index array
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(lengths.sum()) - np.repeat(offsets - start, lengths)
+        return np.repeat(query, lengths), positions
+
+    def _squared_distances(self, points, query, positions):
+        d2 = (self.sorted.x[positions] - points[query, 0]) ** 2
+        d2 += (self.sorted.y[positions] - points[query, 1]) ** 2
+        d2 += (self.sorted.z[positions] - points[query, 2]) ** 2
+        return d2
+
+    def _split(self, query, positions, m):
+        if m == 0:
+            return []
+        counts = np.bincount(query, minlength=m)
+        return np.split(self.order[positions], np.cumsum(counts)[:-1])
+
+    # --- Radius queries ---
+
+    def query_radius(self, points, radius):
+        """
+        Indices of the particles within radius of each point: one array for
+        a single point, or a list of arrays for an (m, 3) batch.
+        """
+        batch = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        query, positions = self._candidates(batch - radius, batch + radius)
+        inside = self._squared_distances(batch, query, positions) <= radius * radius
+        results = self._split(query[inside], positions[inside], len(batch))
+        return results if np.ndim(points) == 2 else results[0]
+
+    def count_radius(self, points, radius):
+        """Number of particles within radius of each point."""
+        batch = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        query, positions = self._candidates(batch - radius, batch + radius)
+        inside = self._squared_distances(batch, query, positions) <= radius * radius
+        counts = np.bincount(query[inside], minlength=len(batch))
+        return counts if np.ndim(points) == 2 else int(counts[0])
+
+    # --- Box queries ---
+
+    def count_box(self, lows, highs):
+        """Number of particles in each axis-aligned box lows[i] <= p <= highs[i]."""
+        lo_batch = np.atleast_2d(np.asarray(lows, dtype=np.float64))
+        hi_batch = np.atleast_2d(np.asarray(highs, dtype=np.float64))
+        query, positions = self._candidates(lo_batch, hi_batch)
+        inside = np.ones(len(positions), dtype=bool)
+        for axis, column in enumerate(self.sorted.columns()):
+            values = column[positions]
+            inside &= (values >= lo_batch[query, axis]) & (values <= hi_batch[query, axis])
+        counts = np.bincount(query[inside], minlength=len(lo_batch))
+        return counts if np.ndim(lows) == 2 else int(counts[0])
+
+    # --- Nearest neighbors ---
+
+    def knn(self, points, k):
+        """
+        The k nearest particles to each point, as (distances, indices), each
+        of shape (m, k) for a batch or (k,) for a single point, nearest
+        first. The search cube around every unfinished query doubles until
+        it holds k particles within its half-width, which guarantees that
+        the k nearest are among its candidates.
+        """
+        if not 0 < k <= len(self):
+            raise ValueError("k must be between 1 and the number of particles")
+        batch = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        m = len(batch)
+        distances = np.empty((m, k))
+        positions_out = np.empty((m, k), dtype=np.int64)
+        pending = np.arange(m)
+        half = self.cell_size * max(1.0, (k / PER_CELL) ** (1 / 3))
+        while len(pending):
+            p = batch[pending]
+            query, positions = self._candidates(p - half, p + half)
+            d2 = self._squared_distances(p, query, positions)
+            found = np.bincount(query[d2 <= half * half], minlength=len(pending))
+            done = found >= k
+            if done.any():
+                keep = done[query]
+                query, positions, d2 = query[keep], positions[keep], d2[keep]
+                by_distance = np.lexsort((d2, query))
+                query, positions, d2 = query[by_distance], positions[by_distance], d2[by_distance]
+                group_starts = np.flatnonzero(np.r_[True, query[1:] != query[:-1]])
+                rank = np.arange(len(query)) - np.repeat(group_starts, np.diff(np.r_[group_starts, len(query)]))
+                top = rank < k
+                rows = pending[query[top]]
+                distances[rows, rank[top]] = np.sqrt(d2[top])
+                positions_out[rows, rank[top]] = positions[top]
+            pending = pending[~done]
+            half *= 2
+        indices = self.order[positions_out]
+        return (distances, indices) if np.ndim(points) == 2 else (distances[0], indices[0])
+
+# --- Brute-force baselines (O(N) per query) ---
+
+def brute_radius(store, point, radius):
+    return store.within_radius(point, radius)
+
+def brute_count_box(store, low, high):
+    return len(store.where(lambda x, y, z: (x >= low[0]) & (x <= high[0]) & (y >= low[1])
+                           & (y <= high[1]) & (z >= low[2]) & (z <= high[2])))
+
+def brute_knn(store, point, k):
+    dist = store.distance_to(point)
+    nearest = np.argpartition(dist, k - 1)[:k]
+    nearest = nearest[np.argsort(dist[nearest], kind="stable")]
+    return dist[nearest], nearest
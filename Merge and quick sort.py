@@ -1,11 +1,16 @@
 # Bereket Gebremariam
+import argparse
+import os
+import tempfile
+import threading
 import time
-import sys
-import random
+import numpy as np
 import psutil
-
-# Increase recursion limit for deep recursive calls
-sys.setrecursionlimit(2000)
+from benchmark import Suite, make_datasets
+from sorting import SortStats, adaptive_sort, introsort, natural_merge_sort, quicksort_3way
+from sorting.vectorized import radix_sort, vectorized_quicksort
+from sorting.parallel import parallel_sort
+from sorting.external import external_sort
 
 # --- MERGE SORT IMPLEMENTATION ---
 def merge_sort(arr):
@@ -40,10 +45,19 @@ def merge_sort(arr):
 
 # --- QUICK SORT IMPLEMENTATION ---
 def quick_sort(arr, low, high):
-    if low < high:
-        pi = partition(arr, low, high)
-        quick_sort(arr, low, pi - 1)
-        quick_sort(arr, pi + 1, high)
+    # Explicit stack instead of recursion: push the larger side and keep
+    # working on the smaller one, so the stack stays O(log n) deep
+    stack = [(low, high)]
+    while stack:
+        low, high = stack.pop()
+        while low < high:
+            pi = partition(arr, low, high)
+            if pi - low < high - pi:
+                stack.append((pi + 1, high))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1))
+                low = pi + 1
 
 def partition(arr, low, high):
     mid = (low + high) // 2
@@ -66,64 +80,250 @@ def partition(arr, low, high):
     arr[i + 1], arr[high] = arr[high], arr[i + 1]
     return i + 1
 
+# --- INSTRUMENTED VARIANTS (opt-in copies that fill in a SortStats) ---
+def counted_merge_sort(arr, stats, depth=1):
+    stats.record_depth(depth)
+    if len(arr) > 1:
+        mid = len(arr) // 2
+        left_half = arr[:mid]
+        right_half = arr[mid:]
+        stats.moves += len(arr)  # copies into the two halves
+
+        counted_merge_sort(left_half, stats, depth + 1)
+        counted_merge_sort(right_half, stats, depth + 1)
+
+        i = j = k = 0
+
+        while i < len(left_half) and j < len(right_half):
+            if left_half[i] < right_half[j]:
+                arr[k] = left_half[i]
+                i += 1
+            else:
+                arr[k] = right_half[j]
+                j += 1
+            k += 1
+        stats.comparisons += k  # one comparison per element merged in the loop
+
+        while i < len(left_half):
+            arr[k] = left_half[i]
+            i += 1
+            k += 1
+
+        while j < len(right_half):
+            arr[k] = right_half[j]
+            j += 1
+            k += 1
+        stats.moves += len(arr)  # every element written back once
+
+def counted_quick_sort(arr, low, high, stats):
+    # Segments carry their partition-tree depth (the recursion depth a
+    # recursive quick_sort would reach)
+    stack = [(low, high, 1)]
+    while stack:
+        low, high, depth = stack.pop()
+        while low < high:
+            stats.record_depth(depth)
+            pi = counted_partition(arr, low, high, stats)
+            depth += 1
+            if pi - low < high - pi:
+                stack.append((pi + 1, high, depth))
+                high = pi - 1
+            else:
+                stack.append((low, pi - 1, depth))
+                low = pi + 1
+
+def counted_partition(arr, low, high, stats):
+    # Median-of-three: 3 comparisons and up to 3 swaps, then the pivot swap
+    mid = (low + high) // 2
+    stats.comparisons += 3
+    if arr[low] > arr[mid]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+        stats.swaps += 1
+    if arr[low] > arr[high]:
+        arr[low], arr[high] = arr[high], arr[low]
+        stats.swaps += 1
+    if arr[mid] > arr[high]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+        stats.swaps += 1
+
+    pivot = arr[mid]
+    arr[mid], arr[high] = arr[high], arr[mid]
+
+    # The Lomuto loop is the unchanged one from partition(): it compares
+    # every element once and swaps once per element <= pivot, so the counts
+    # follow from the final index
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    stats.comparisons += high - low
+    stats.swaps += (i + 1 - low) + 2  # loop swaps, pivot-to-end and final swap
+    stats.record_partition(i + 1 - low, high - i - 1)
+    return i + 1
+
 # --- PERFORMANCE TESTING AND ANALYSIS ---
-def get_memory_usage():
-    process = psutil.Process()
-    return process.memory_info().rss / (1024 * 1024)  # in MB
+# Each sort runs on a fresh copy made outside the timed region; memory is the
+# tracemalloc peak of one extra run, so the input copy is not counted and
+# in-place sorts no longer show up as ~0 MB RSS deltas
+SORTS = {
+    'Merge Sort': (merge_sort, list),
+    'Natural Merge Sort': (natural_merge_sort, list),
+    'Quick Sort': (lambda arr: quick_sort(arr, 0, len(arr) - 1), list),
+    'Introsort': (lambda arr: introsort(arr, 0, len(arr) - 1), list),
+    '3-Way Quick Sort': (lambda arr: quicksort_3way(arr, 0, len(arr) - 1), list),
+    'Adaptive Sort': (adaptive_sort, list),
+    # NumPy backends sort a typed int64 copy (conversion not timed)
+    'NumPy Quick Sort': (vectorized_quicksort, lambda data: np.array(data, dtype=np.int64)),
+    'NumPy Radix Sort': (radix_sort, lambda data: np.array(data, dtype=np.int64)),
+}
 
-def run_tests(size):
-    # Data Generation
-    sorted_data = list(range(size))
-    reverse_sorted_data = list(range(size, 0, -1))
-    random_data = [random.randint(0, size) for _ in range(size)]
-    
+def run_tests(size, suite=None, repeats=3, seed=532):
+    suite = suite if suite is not None else Suite('sorting', repeats=repeats)
+    test_data = make_datasets(size, seed, ['Sorted Data', 'Reverse Sorted Data',
+                                           'Random Data', 'Few Unique Data'])
+
+    results = {}
+    for name, data in test_data.items():
+        results[name] = {}
+        for algo, (sort_func, copy) in SORTS.items():
+            measured = suite.run(f"{name}/{algo}/{size}", sort_func, lambda: copy(data))
+            results[name][algo] = {
+                'time (ms)': measured['median_ns'] / 1e6,
+                'ci95 (ms)': measured['ci95_ns'] / 1e6,
+                'memory (MB)': measured['peak_bytes'] / (1024 * 1024),
+            }
+        # Operation counts from one instrumented run, kept out of the timings
+        merge_stats = SortStats()
+        counted_merge_sort(list(data), merge_stats)
+        quick_stats = SortStats()
+        data_counted = list(data)
+        counted_quick_sort(data_counted, 0, len(data_counted) - 1, quick_stats)
+        for algo, stats in (('Merge Sort', merge_stats), ('Quick Sort', quick_stats)):
+            suite.results[f"{name}/{algo}/{size}"].update(stats.as_dict())
+            results[name][algo]['counts'] = stats
+
+        # Which engine adaptive_sort dispatched to, and why
+        strategy = adaptive_sort(list(data))
+        results[name]['Adaptive Sort']['strategy'] = f"{strategy.name} ({strategy.reason})"
+
+    return results
+
+def run_parallel_scaling(size, worker_counts, engine="merge"):
+    # Speedup of parallel_sort over its single-worker run, per dataset
     test_data = {
-        'Sorted Data': sorted_data.copy(),
-        'Reverse Sorted Data': reverse_sorted_data.copy(),
-        'Random Data': random_data.copy()
+        'Sorted Data': np.arange(size, dtype=np.int64),
+        'Reverse Sorted Data': np.arange(size, 0, -1, dtype=np.int64),
+        'Random Data': np.random.randint(0, size + 1, size=size).astype(np.int64)
     }
-    
+
     results = {}
-    
     for name, data in test_data.items():
-        # Test Merge Sort
-        data_merge_sort = data.copy()
-        start_time = time.perf_counter()
-        initial_mem_merge = get_memory_usage()
-        merge_sort(data_merge_sort)
-        end_time = time.perf_counter()
-        final_mem_merge = get_memory_usage()
-        
-        merge_time = (end_time - start_time) * 1000
-        merge_mem = final_mem_merge - initial_mem_merge
+        results[name] = {}
+        for workers in worker_counts:
+            data_parallel = data.copy()
+            start_time = time.perf_counter()
+            parallel_sort(data_parallel, workers=workers, engine=engine)
+            end_time = time.perf_counter()
+            results[name][workers] = (end_time - start_time) * 1000
+    return results
+
+def measure_peak_rss(func, *args, interval=0.01):
+    # Run func while a background thread samples RSS; returns (result, peak MB)
+    process = psutil.Process()
+    peak = process.memory_info().rss
+    done = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not done.wait(interval):
+            peak = max(peak, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func(*args)
+    finally:
+        done.set()
+        sampler.join()
+    return result, max(peak, process.memory_info().rss) / (1024 * 1024)
+
+def run_external_sort_test(size, memory_budget):
+    # Sort an on-disk int64 file through external_sort under a memory budget
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'input.bin')
+        output_path = os.path.join(work_dir, 'output.bin')
+        np.random.randint(0, size + 1, size=size).astype(np.int64).tofile(input_path)
+        file_mb = os.path.getsize(input_path) / (1024 * 1024)
 
-        # Test Quick Sort
-        data_quick_sort = data.copy()
         start_time = time.perf_counter()
-        initial_mem_quick = get_memory_usage()
-        quick_sort(data_quick_sort, 0, len(data_quick_sort) - 1)
+        runs, peak_rss = measure_peak_rss(external_sort, input_path, output_path, memory_budget)
         end_time = time.perf_counter()
-        final_mem_quick = get_memory_usage()
 
-        quick_time = (end_time - start_time) * 1000
-        quick_mem = final_mem_quick - initial_mem_quick
+        result = np.memmap(output_path, dtype=np.int64, mode='r')
+        is_sorted = bool(np.all(result[:-1] <= result[1:]))
+        del result
 
-        results[name] = {
-            'Merge Sort': {'time (ms)': merge_time, 'memory (MB)': merge_mem},
-            'Quick Sort': {'time (ms)': quick_time, 'memory (MB)': quick_mem}
-        }
-    
-    return results
+    elapsed = end_time - start_time
+    return {
+        'file (MB)': file_mb,
+        'runs': runs,
+        'time (ms)': elapsed * 1000,
+        'throughput (MB/s)': file_mb / elapsed,
+        'peak RSS (MB)': peak_rss,
+        'sorted': is_sorted
+    }
 
 # Main execution block
 if __name__ == "__main__":
-    n = 100000  # Size of the dataset
+    parser = argparse.ArgumentParser(description="Merge and quick sort performance tests")
+    parser.add_argument("--size", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=str, help="write results as JSON (or CSV if *.csv)")
+    parser.add_argument("--compare", type=str, help="baseline JSON to check for regressions")
+    args = parser.parse_args()
+
+    n = args.size  # Size of the dataset
     print(f"--- Running performance tests with a dataset size of n = {n} ---")
-    performance_metrics = run_tests(n)
+    suite = Suite('sorting', repeats=args.repeats)
+    performance_metrics = run_tests(n, suite)
     
     for dataset, algos in performance_metrics.items():
         print(f"\n--- Results for {dataset} ---")
         for algo, metrics in algos.items():
             print(f"  {algo}:")
-            print(f"    Execution Time: {metrics['time (ms)']:.2f} ms")
-            print(f"    Memory Usage: {metrics['memory (MB)']:.2f} MB")
\ No newline at end of file
+            print(f"    Execution Time: {metrics['time (ms)']:.2f} ms (± {metrics['ci95 (ms)']:.2f})")
+            print(f"    Peak Extra Memory: {metrics['memory (MB)']:.2f} MB")
+            if 'counts' in metrics:
+                counts = metrics['counts']
+                print(f"    Comparisons: {counts.comparisons:,}  Swaps: {counts.swaps:,}  "
+                      f"Moves: {counts.moves:,}  Max Depth: {counts.max_depth}")
+            if 'strategy' in metrics:
+                print(f"    Strategy: {metrics['strategy']}")
+
+    if args.output:
+        suite.save(args.output)
+    if args.compare:
+        suite.compare(args.compare)
+
+    # Parallel scaling: speedup vs. number of worker processes
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, 32, 64, cores} & set(range(1, cores + 1)))
+    print(f"\n--- Parallel merge sort scaling (n = {n}, up to {cores} cores) ---")
+    scaling = run_parallel_scaling(n, worker_counts)
+    for dataset, timings in scaling.items():
+        print(f"\n--- {dataset} ---")
+        for workers, elapsed in timings.items():
+            print(f"  {workers:>3} workers: {elapsed:10.2f} ms  (speedup {timings[1] / elapsed:.2f}x)")
+
+    # External sort: file larger than the memory budget
+    budget = 4 * 1024 * 1024
+    external = run_external_sort_test(10 * n, budget)
+    print(f"\n--- External sort of {external['file (MB)']:.1f} MB with a {budget // (1024 * 1024)} MB budget ---")
+    print(f"  Runs spilled: {external['runs']}")
+    print(f"  Execution Time: {external['time (ms)']:.2f} ms")
+    print(f"  Throughput: {external['throughput (MB/s)']:.2f} MB/s")
+    print(f"  Peak RSS: {external['peak RSS (MB)']:.2f} MB")
+    print(f"  Output sorted: {external['sorted']}")
@@ -0,0 +1,90 @@
+"""
+Final Group Project - asyncio Scheduler
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
+University of the Cumberlands – Kentucky
+
+asyncio wrapper around the Phase 3 TaskScheduler (heap + hash table).
+"""
+
+import asyncio
+import time
+from TaskSchedulerPhase3 import TaskScheduler
+
+SECONDS_PER_DAY = 86400
+
+class AsyncTaskScheduler:
+    """
+    Awaitable front end for TaskScheduler, for use inside one event loop.
+
+    Waiting coroutines sleep on an asyncio.Event instead of polling
+    get_next_task(). Every add/update swaps in a fresh Event and sets the old
+    one, waking all current waiters so they can re-check the queue. All calls
+    run on the loop thread, so the underlying scheduler needs no locking.
+    """
+
+    def __init__(self, scheduler=None, clock=time.time):
+        self.scheduler = scheduler if scheduler is not None else TaskScheduler()
+        self.clock = clock  # returns current Unix time in seconds
+        self._wakeup = asyncio.Event()
+
+    def _notify(self):
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def _wait(self, timeout=None):
+        """Sleep until the queue changes or timeout seconds pass."""
+        wakeup = self._wakeup
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def due_time(self, task):
+        """Unix time at which a task becomes due (start of its deadline day, UTC)."""
+        return task.deadline * SECONDS_PER_DAY
+
+    def add_task(self, task_id, description, deadline, urgency):
+        """Add a task and wake any waiting coroutines. Never blocks."""
+        self.scheduler.add_task(task_id, description, deadline, urgency)
+        self._notify()
+
+    def add_tasks(self, tasks):
+        """Add a batch of (task_id, description, deadline, urgency) with one heapify."""
+        self.scheduler.add_tasks(tasks)
+        self._notify()
+
+    def update_task(self, task_id, new_deadline=None, new_urgency=None):
+        self.scheduler.update_task(task_id, new_deadline, new_urgency)
+        self._notify()  # an earlier deadline may change what due_task waits for
+
+    def cancel_task(self, task_id):
+        return self.scheduler.cancel_task(task_id)
+
+    def find_task(self, task_id):
+        return self.scheduler.find_task(task_id)
+
+    def __len__(self):
+        return len(self.scheduler.tasks)
+
+    async def next_task(self):
+        """Remove and return the highest-priority task, waiting until one exists."""
+        while self.scheduler.is_empty():
+            await self._wait()
+        return self.scheduler.complete_task()
+
+    async def due_task(self):
+        """
+        Remove and return the highest-priority task once its deadline arrives.
+        Sleeps until the earliest deadline, waking early if a new task or
+        update could change which task is next.
+        """
+        while True:
+            if self.scheduler.is_empty():
+                await self._wait()
+                continue
+            delay = self.due_time(self.scheduler.get_next_task()) - self.clock()
+            if delay <= 0:
+                return self.scheduler.complete_task()
+            await self._wait(delay)
@@ -0,0 +1,139 @@
+"""
+Final Group Project - Concurrent Scheduler
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80) - Full Term
+University of the Cumberlands – Kentucky
+
+Thread-safe Task Scheduler for multiple producer and worker threads.
+"""
+
+import threading
+from TaskScheduler_final import TaskScheduler
+
+
+class ConcurrentTaskScheduler:
+    """
+    Thread-safe scheduler built from several TaskScheduler shards.
+
+    - Each task_id always maps to the same shard, so duplicate-ID checks and
+      find_task only need that shard's lock.
+    - A counting semaphore holds one permit per queued task. A worker that
+      acquires a permit is guaranteed a task is waiting for it, so
+      complete_task can block (with an optional timeout) without polling.
+    - Workers pick the shard with the smallest top entry (merge-at-top) and
+      pop it under that shard's lock only, so producers and workers touching
+      different shards never contend.
+
+    Across shards the order is best-effort while other threads are mutating
+    the scheduler; with a single worker it is the exact priority order.
+    """
+
+    def __init__(self, num_shards=8):
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        self.shards = [TaskScheduler() for _ in range(num_shards)]
+        self.locks = [threading.Lock() for _ in range(num_shards)]
+        self.available = threading.Semaphore(0)  # one permit per queued task
+
+    def _shard_index(self, task_id):
+        return hash(task_id) % len(self.shards)
+
+    def add_task(self, task_id, description, deadline, urgency):
+        """Add a task without blocking on workers. Locks one shard."""
+        i = self._shard_index(task_id)
+        with self.locks[i]:
+            self.shards[i].add_task(task_id, description, deadline, urgency)
+        self.available.release()
+
+    def add_tasks(self, tasks):
+        """
+        Bulk insert (task_id, description, deadline, urgency) tuples, one
+        heapify per shard. All or nothing, like TaskScheduler.add_tasks:
+        every shard the batch touches is locked (in index order, so two
+        batches cannot deadlock), the whole batch is checked for duplicate
+        IDs, and only then is anything inserted.
+        """
+        batches = [[] for _ in self.shards]
+        for task_id, description, deadline, urgency in tasks:
+            batches[self._shard_index(task_id)].append((task_id, description, deadline, urgency))
+        touched = [i for i, batch in enumerate(batches) if batch]
+        held = []
+        try:
+            for i in touched:
+                self.locks[i].acquire()
+                held.append(i)
+            for i in touched:
+                seen = set()
+                for task_id, _, _, _ in batches[i]:
+                    if task_id in self.shards[i].tasks or task_id in seen:
+                        raise ValueError(f"Task ID {task_id} already exists")
+                    seen.add(task_id)
+            for i in touched:
+                self.shards[i].add_tasks(batches[i])
+        finally:
+            for i in held:
+                self.locks[i].release()
+        added = sum(len(batch) for batch in batches)
+        if added:
+            self.available.release(added)
+
+    def _top(self, i):
+        """Best-effort read of shard i's top entry without taking its lock."""
+        try:
+            return self.shards[i].heap[0]
+        except IndexError:
+            return None
+
+    def complete_task(self, block=True, timeout=None):
+        """
+        Remove and return the highest-priority task.
+        Blocks until a task is available (or timeout seconds pass) unless
+        block is False; raises IndexError if no task could be claimed.
+        """
+        if not self.available.acquire(blocking=block, timeout=timeout if block else None):
+            raise IndexError("No tasks available")
+        # A permit guarantees a task exists for us; find and pop it.
+        while True:
+            tops = []
+            for i in range(len(self.shards)):
+                top = self._top(i)
+                if top is not None:
+                    tops.append((top, i))
+            # Try shards from smallest top; another worker may beat us to one
+            for _, i in sorted(tops):
+                with self.locks[i]:
+                    if not self.shards[i].is_empty():
+                        return self.shards[i].complete_task()
+
+    def get_next_task(self):
+        """Peek the highest-priority task. Locks each shard in turn."""
+        best = None
+        for i, shard in enumerate(self.shards):
+            with self.locks[i]:
+                if shard.is_empty():
+                    continue
+                task = shard.get_next_task()
+            key = (task.deadline, -task.urgency, task.task_id)
+            if best is None or key < best[0]:
+                best = (key, task)
+        if best is None:
+            raise IndexError("No tasks available")
+        return best[1]
+
+    def find_task(self, task_id):
+        """Retrieve a task by ID. Locks only the task's shard."""
+        i = self._shard_index(task_id)
+        with self.locks[i]:
+            return self.shards[i].find_task(task_id)
+
+    def __len__(self):
+        total = 0
+        for i, shard in enumerate(self.shards):
+            with self.locks[i]:
+                total += len(shard.tasks)
+        return total
+
+    def is_empty(self):
+        """True if no shard holds a task (a snapshot; may change immediately)."""
+        return len(self) == 0
@@ -0,0 +1,300 @@
+"""
+Final Group Project - Persistent Scheduler
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
+University of the Cumberlands – Kentucky
+
+Crash-safe Task Scheduler: append-only write-ahead log plus binary snapshots.
+"""
+
+import os
+import struct
+import time
+import zlib
+from TaskSchedulerPhase3 import TaskScheduler, parse_deadline
+
+# Log record: op, task_id, deadline day key, urgency, description length,
+# then the UTF-8 description and a CRC32 of everything before it.
+_RECORD = struct.Struct("<BqiiI")
+_CRC = struct.Struct("<I")
+_OP_ADD, _OP_UPDATE, _OP_REMOVE = 1, 2, 3
+
+# Snapshot: magic, log generation, task count, then one _SNAP_TASK +
+# description per task, then a CRC32 of the whole body.
+_SNAP_MAGIC = b"TSKSNAP1"
+_SNAP_HEADER = struct.Struct("<8sQQ")
+_SNAP_TASK = struct.Struct("<qiiI")
+
+
+class PersistentTaskScheduler(TaskScheduler):
+    """
+    Phase 3 TaskScheduler whose state survives restarts.
+
+    Every add/update/complete/cancel is encoded before anything changes, so
+    a task that cannot be logged is rejected with ValueError and leaves the
+    scheduler untouched; the record is appended to a write-ahead log once
+    the change succeeds in memory, and flushed to the OS before the call
+    returns, so a process crash loses no acknowledged operation.
+
+    Only fsync is batched (group commit), which protects against power loss
+    and OS crashes: the log is synced once group_size operations have
+    accumulated, or on the first write after sync_interval seconds, or when
+    sync()/close() is called. There is no timer, so an idle scheduler keeps
+    its last unsynced operations in the OS page cache until the next write;
+    call sync() when that matters. Every snapshot_every logged operations
+    the whole scheduler is written to a compact binary snapshot and a new log
+    generation is started, so recovery is one heapify plus a short replay.
+
+    Task IDs must be integers (they are stored as 64-bit values).
+    """
+
+    def __init__(self, directory, group_size=64, sync_interval=0.05,
+                 snapshot_every=100000, d=2, backend="heap", indexes=False):
+        super().__init__(d, backend, indexes)
+        self.directory = directory
+        self.group_size = group_size
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        os.makedirs(directory, exist_ok=True)
+        self._unsynced = 0
+        self._logged = 0
+        self._last_sync = time.monotonic()
+        self.generation = self._recover()
+        self._log = open(self._log_path(self.generation), "ab")
+
+    # --- File layout ---
+
+    def _log_path(self, generation):
+        return os.path.join(self.directory, f"tasks.{generation}.log")
+
+    @property
+    def log_path(self):
+        """Path of the current log generation."""
+        return self._log_path(self.generation)
+
+    @property
+    def snapshot_path(self):
+        return self._snapshot_path()
+
+    def _snapshot_path(self):
+        return os.path.join(self.directory, "tasks.snapshot")
+
+    def _fsync_directory(self):
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    # --- Recovery ---
+
+    def _recover(self):
+        """Load the snapshot (one heapify), then replay its log generation."""
+        generation = self._load_snapshot()
+        self._replay_log(self._log_path(generation))
+        # Logs from older generations are already covered by the snapshot
+        for name in os.listdir(self.directory):
+            if name.startswith("tasks.") and name.endswith(".log"):
+                gen = name[len("tasks."):-len(".log")]
+                if gen.isdigit() and int(gen) < generation:
+                    os.remove(os.path.join(self.directory, name))
+        return generation
+
+    def _load_snapshot(self):
+        path = self._snapshot_path()
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            data = f.read()
+        body, (crc,) = data[:-_CRC.size], _CRC.unpack_from(data, len(data) - _CRC.size)
+        magic, generation, count = _SNAP_HEADER.unpack_from(body)
+        if magic != _SNAP_MAGIC or zlib.crc32(body) != crc:
+            raise ValueError(f"Corrupt snapshot: {path}")
+        offset = _SNAP_HEADER.size
+        task_class = self.task_class
+        tasks = self.tasks
+        entries = []
+        for _ in range(count):
+            task_id, day, urgency, length = _SNAP_TASK.unpack_from(body, offset)
+            offset += _SNAP_TASK.size
+            description = body[offset:offset + length].decode("utf-8")
+            offset += length
+            tasks[task_id] = task_class(task_id, description, day, urgency)
+            entries.append((day, -urgency, task_id))
+        self.heap.extend(entries)
+        if self.index is not None:
+            self.index.extend(entries)
+        return generation
+
+    def _replay_log(self, path):
+        """Apply every complete record; cut off a torn record from a crash."""
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + _RECORD.size <= len(data):
+            op, task_id, day, urgency, length = _RECORD.unpack_from(data, offset)
+            end = offset + _RECORD.size + length
+            if end + _CRC.size > len(data):
+                break
+            (crc,) = _CRC.unpack_from(data, end)
+            if zlib.crc32(data[offset:end]) != crc:
+                break
+            if op == _OP_ADD:
+                description = data[offset + _RECORD.size:end].decode("utf-8")
+                self.tasks[task_id] = self.task_class(task_id, description, day, urgency)
+                self.heap.push((day, -urgency, task_id))
+                if self.index is not None:
+                    self.index.add((day, -urgency, task_id))
+            elif op == _OP_UPDATE:
+                task = self.tasks[task_id]
+                if self.index is not None:
+                    self.index.remove((task.deadline, -task.urgency, task_id))
+                    self.index.add((day, -urgency, task_id))
+                task.deadline, task.urgency = day, urgency
+                self.heap.update(task_id, (day, -urgency, task_id))
+            elif op == _OP_REMOVE:
+                entry = self.heap.remove(task_id)
+                if self.index is not None:
+                    self.index.remove(entry)
+                del self.tasks[task_id]
+            offset = end + _CRC.size
+            self._logged += 1
+        if offset < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+    # --- Logging ---
+
+    def _encode(self, op, task_id, day=0, urgency=0, description=""):
+        """One log record as bytes; ValueError if a field does not fit the format."""
+        encoded = description.encode("utf-8")
+        try:
+            record = _RECORD.pack(op, task_id, day, urgency, len(encoded)) + encoded
+        except struct.error as e:
+            raise ValueError(f"Task {task_id!r} cannot be logged: {e}") from None
+        return record + _CRC.pack(zlib.crc32(record))
+
+    def _append(self, records, count=1):
+        """Write already encoded records (count of them) to the log and hand them to the OS."""
+        self._log.write(records)
+        self._log.flush()
+        self._unsynced += count
+        self._logged += count
+
+    def _commit(self):
+        """
+        Group commit: fsync once enough operations have accumulated, or
+        when this write comes sync_interval seconds after the last sync.
+        """
+        if (self._unsynced >= self.group_size
+                or time.monotonic() - self._last_sync >= self.sync_interval):
+            self.sync()
+        if self._logged >= self.snapshot_every:
+            self.snapshot()
+
+    def sync(self):
+        """Force all logged operations to disk."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def snapshot(self):
+        """
+        Write all live tasks to a new snapshot and start a new log generation.
+        The snapshot is written to a temp file and renamed into place, so a
+        crash at any point leaves either the old or the new snapshot intact.
+        """
+        generation = self.generation + 1
+        parts = [_SNAP_HEADER.pack(_SNAP_MAGIC, generation, len(self.tasks))]
+        for task in self.tasks.values():
+            encoded = task.description.encode("utf-8")
+            parts.append(_SNAP_TASK.pack(task.task_id, task.deadline, task.urgency, len(encoded)))
+            parts.append(encoded)
+        body = b"".join(parts)
+        tmp_path = self._snapshot_path() + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+            f.write(_CRC.pack(zlib.crc32(body)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path())
+        self._fsync_directory()
+
+        old_log = self._log
+        self._log = open(self._log_path(generation), "ab")
+        old_log.close()
+        os.remove(self._log_path(self.generation))
+        self.generation = generation
+        self._unsynced = 0
+        self._logged = 0
+
+    def close(self):
+        self.sync()
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- Logged operations ---
+    # Each operation encodes its record first, then changes memory, then
+    # appends, so a failure at either of the first two steps changes nothing.
+
+    def add_task(self, task_id, description, deadline, urgency):
+        record = self._encode(_OP_ADD, task_id, parse_deadline(deadline), urgency, description)
+        super().add_task(task_id, description, deadline, urgency)
+        self._append(record)
+        self._commit()
+
+    def add_tasks(self, tasks):
+        tasks = list(tasks)
+        records = b"".join(self._encode(_OP_ADD, task_id, parse_deadline(deadline), urgency, description)
+                           for task_id, description, deadline, urgency in tasks)
+        super().add_tasks(tasks)
+        self._append(records, len(tasks))
+        self._commit()
+
+    def update_task(self, task_id, new_deadline=None, new_urgency=None):
+        task = self.find_task(task_id)
+        day = parse_deadline(new_deadline) if new_deadline else task.deadline
+        urgency = task.urgency if new_urgency is None else new_urgency
+        record = self._encode(_OP_UPDATE, task_id, day, urgency)
+        super().update_task(task_id, new_deadline, new_urgency)
+        self._append(record)
+        self._commit()
+
+    def complete_task(self):
+        task = super().complete_task()
+        self._append(self._encode(_OP_REMOVE, task.task_id))
+        self._commit()
+        return task
+
+    def complete_tasks(self, k):
+        if k >= len(self.heap):
+            return self.drain()  # logs its own removals
+        completed = super().complete_tasks(k)
+        self._append(b"".join(self._encode(_OP_REMOVE, task.task_id) for task in completed),
+                     len(completed))
+        self._commit()
+        return completed
+
+    def drain(self):
+        drained = super().drain()
+        self._append(b"".join(self._encode(_OP_REMOVE, task.task_id) for task in drained),
+                     len(drained))
+        self._commit()
+        return drained
+
+    def cancel_task(self, task_id):
+        record = self._encode(_OP_REMOVE, task_id)
+        task = super().cancel_task(task_id)
+        self._append(record)
+        self._commit()
+        return task
@@ -5,80 +5,594 @@ Satish Penmatsa
 2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
 University of the Cumberlands – Kentucky
 
-Task Scheduler using a Priority Queue (min-heap) and Hash Table (dict).
+Task Scheduler using an Indexed Priority Queue (min-heap) and Hash Table (dict),
+with an optional bucket (calendar) queue backend for day-granular deadlines
+and optional sorted secondary indexes for range and top-k queries.
 """
 
 import heapq
-from datetime import datetime
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from functools import lru_cache
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DEADLINE_ERROR = "Invalid deadline format. Use YYYY-MM-DD"
+
+@lru_cache(maxsize=4096)
+def parse_deadline(deadline):
+    """
+    Convert a "YYYY-MM-DD" string into an integer day key (days since
+    1970-01-01). Results are memoized since real workloads reuse a small
+    set of dates; well-formed strings skip strptime entirely.
+    """
+    if len(deadline) == 10 and deadline[4] == "-" and deadline[7] == "-":
+        digits = deadline[:4] + deadline[5:7] + deadline[8:]
+        if digits.isascii() and digits.isdigit():
+            try:
+                day = date(int(deadline[:4]), int(deadline[5:7]), int(deadline[8:]))
+            except ValueError:
+                raise ValueError(_DEADLINE_ERROR) from None
+            return day.toordinal() - _EPOCH_ORDINAL
+    # Slow path for anything strptime still accepts (e.g. "2025-1-5")
+    try:
+        day = datetime.strptime(deadline, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(_DEADLINE_ERROR) from None
+    return day.toordinal() - _EPOCH_ORDINAL
 
 class Task:
+    __slots__ = ("task_id", "description", "deadline", "urgency")  # no per-task __dict__
+
     def __init__(self, task_id, description, deadline, urgency):
         self.task_id = task_id
         self.description = description
-        self.deadline = deadline  # Unix timestamp
+        self.deadline = deadline  # day key: days since 1970-01-01
         self.urgency = urgency
-        self.is_deleted = False  # For lazy deletion
 
     def __str__(self):
-        # Convert timestamp back to readable date for display
-        return f"ID: {self.task_id}, Desc: {self.description}, Due: {datetime.fromtimestamp(self.deadline).strftime('%Y-%m-%d')}, Urg: {self.urgency}"
+        # Convert day key back to readable date for display
+        return f"ID: {self.task_id}, Desc: {self.description}, Due: {date.fromordinal(self.deadline + _EPOCH_ORDINAL).isoformat()}, Urg: {self.urgency}"
+
+class IndexedHeap:
+    """
+    Addressable d-ary min-heap of (deadline, -urgency, task_id) entries.
+
+    A position map (task_id -> index in self.heap) lets us change the key of
+    or remove any task in O(log n) instead of pushing duplicates and deleting
+    lazily, so the heap always holds exactly one entry per live task.
+    """
+
+    def __init__(self, d=2):
+        if d < 2:
+            raise ValueError("Heap arity must be at least 2")
+        self.d = d
+        self.heap = []      # list of tuples: (deadline, -urgency, task_id)
+        self.position = {}  # task_id -> index in self.heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, task_id):
+        return task_id in self.position
+
+    def _sift_up(self, i):
+        heap, position, d = self.heap, self.position, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if heap[parent] <= entry:
+                break
+            heap[i] = heap[parent]
+            position[heap[i][2]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def _sift_down(self, i):
+        heap, position, d = self.heap, self.position, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Pick the smallest child among the (up to) d children
+            child = first
+            for c in range(first + 1, min(first + d, n)):
+                if heap[c] < heap[child]:
+                    child = c
+            if entry <= heap[child]:
+                break
+            heap[i] = heap[child]
+            position[heap[i][2]] = i
+            i = child
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def push(self, entry):
+        """Insert a new entry. O(log n)."""
+        task_id = entry[2]
+        if task_id in self.position:
+            raise ValueError(f"Task ID {task_id} already in heap")
+        self.heap.append(entry)
+        self._sift_up(len(self.heap) - 1)
+
+    def extend(self, entries):
+        """
+        Insert many new entries at once. When the batch is large relative to
+        the heap, rebuild bottom-up (Floyd's heapify) in O(n + m) instead of
+        m separate O(log n) pushes.
+        """
+        entries = list(entries)
+        if len(entries) * 8 < len(self.heap):
+            for entry in entries:
+                self.push(entry)
+            return
+        heap, position = self.heap, self.position
+        for entry in entries:
+            if entry[2] in position:
+                raise ValueError(f"Task ID {entry[2]} already in heap")
+            position[entry[2]] = len(heap)
+            heap.append(entry)
+        for i in range((len(heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def drain(self):
+        """Remove and return every entry in priority order. O(n log n) in C."""
+        entries = sorted(self.heap)
+        self.heap = []
+        self.position = {}
+        return entries
+
+    def peek(self):
+        """Return the smallest entry without removing it. O(1)."""
+        if not self.heap:
+            raise IndexError("No tasks available")
+        return self.heap[0]
+
+    def pop(self):
+        """Remove and return the smallest entry. O(log n)."""
+        if not self.heap:
+            raise IndexError("No tasks available")
+        return self.remove(self.heap[0][2])
+
+    def remove(self, task_id):
+        """Remove the entry for task_id from anywhere in the heap. O(log n)."""
+        i = self.position.pop(task_id)
+        last = self.heap.pop()
+        if i < len(self.heap):
+            # Move the last entry into the hole and restore heap order
+            removed = self.heap[i]
+            self.heap[i] = last
+            self.position[last[2]] = i
+            if last < removed:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+            return removed
+        return last
+
+    def decrease_key(self, task_id, entry):
+        """Replace task_id's entry with a smaller one (higher priority). O(log n)."""
+        i = self.position[task_id]
+        if entry > self.heap[i]:
+            raise ValueError("New key is larger than current key")
+        self.heap[i] = entry
+        self._sift_up(i)
+
+    def increase_key(self, task_id, entry):
+        """Replace task_id's entry with a larger one (lower priority). O(log n)."""
+        i = self.position[task_id]
+        if entry < self.heap[i]:
+            raise ValueError("New key is smaller than current key")
+        self.heap[i] = entry
+        self._sift_down(i)
+
+    def update(self, task_id, entry):
+        """Change task_id's entry in whichever direction is needed. O(log n)."""
+        if entry < self.heap[self.position[task_id]]:
+            self.decrease_key(task_id, entry)
+        else:
+            self.increase_key(task_id, entry)
+
+class _Bucket:
+    """
+    Task ids sharing one (deadline, -urgency) key, as a heap so the lowest
+    id comes first. ids may hold stale ids left by update/remove; live
+    counts the ids whose task is still in this bucket.
+    """
+    __slots__ = ("ids", "live")
 
-class TaskScheduler:
     def __init__(self):
+        self.ids = []
+        self.live = 0
+
+class BucketQueue:
+    """
+    Calendar (bucket) queue of (deadline, -urgency, task_id) entries.
+
+    Deadlines are whole days and urgency is a small integer, so there are few
+    distinct (deadline, -urgency) keys. Each key gets a bucket holding a heap
+    of task ids; a small heap over the distinct keys finds the lowest
+    non-empty bucket. With k keys and b ids per bucket, insert and pop are
+    O(log k + log b), both small since b is about n / k. update/remove leave
+    the old id behind lazily; a bucket is compacted once its stale ids
+    outnumber its live ones, so garbage stays bounded by the live count.
+    Same interface as IndexedHeap.
+    """
+
+    def __init__(self):
+        self.entries = {}  # task_id -> current (deadline, -urgency, task_id)
+        self.buckets = {}  # (deadline, -urgency) -> _Bucket
+        self.keys = []     # heap of bucket keys
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, task_id):
+        return task_id in self.entries
+
+    def push(self, entry):
+        """Insert a new entry. O(log b) (plus O(log k) for a new key)."""
+        task_id = entry[2]
+        if task_id in self.entries:
+            raise ValueError(f"Task ID {task_id} already in heap")
+        self.entries[task_id] = entry
+        key = (entry[0], entry[1])
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = _Bucket()
+            heapq.heappush(self.keys, key)
+        heapq.heappush(bucket.ids, task_id)
+        bucket.live += 1
+
+    def extend(self, entries):
+        """Insert many new entries. O(m log b)."""
+        for entry in entries:
+            self.push(entry)
+
+    def drain(self):
+        """Remove and return every entry in priority order."""
+        entries = sorted(self.entries.values())
+        self.entries = {}
+        self.buckets = {}
+        self.keys = []
+        return entries
+
+    def _leave(self, old):
+        """
+        Account for an entry that left its bucket (already gone from
+        self.entries). Compacts the bucket once stale ids outnumber live
+        ones; each compaction is paid for by the removals before it, so
+        this is amortized O(1).
+        """
+        key = (old[0], old[1])
+        bucket = self.buckets[key]
+        bucket.live -= 1
+        if len(bucket.ids) - bucket.live > bucket.live:
+            entries = self.entries
+            live_ids = set()
+            for task_id in bucket.ids:
+                entry = entries.get(task_id)
+                if entry is not None and entry[0] == key[0] and entry[1] == key[1]:
+                    live_ids.add(task_id)  # a set also drops duplicate ids
+            bucket.ids = list(live_ids)
+            heapq.heapify(bucket.ids)
+
+    def peek(self):
+        """
+        Return the smallest entry without removing it. Stale ids at the top
+        of a bucket are popped here (amortized against the pushes that
+        added them), and emptied buckets are dropped.
+        """
+        entries = self.entries
+        while self.keys:
+            key = self.keys[0]
+            ids = self.buckets[key].ids
+            while ids:
+                entry = entries.get(ids[0])
+                if entry is not None and entry[0] == key[0] and entry[1] == key[1]:
+                    return entry
+                heapq.heappop(ids)  # stale id: task was updated or removed
+            del self.buckets[key]
+            heapq.heappop(self.keys)
+        raise IndexError("No tasks available")
+
+    def pop(self):
+        """Remove and return the smallest entry. Amortized O(log b)."""
+        entry = self.peek()
+        bucket = self.buckets[self.keys[0]]
+        heapq.heappop(bucket.ids)
+        bucket.live -= 1
+        del self.entries[entry[2]]
+        return entry
+
+    def remove(self, task_id):
+        """Remove task_id's entry; its id is dropped lazily from its bucket. Amortized O(1)."""
+        entry = self.entries.pop(task_id)
+        self._leave(entry)
+        return entry
+
+    def decrease_key(self, task_id, entry):
+        """Replace task_id's entry with a smaller one (higher priority)."""
+        if entry > self.entries[task_id]:
+            raise ValueError("New key is larger than current key")
+        self.update(task_id, entry)
+
+    def increase_key(self, task_id, entry):
+        """Replace task_id's entry with a larger one (lower priority)."""
+        if entry < self.entries[task_id]:
+            raise ValueError("New key is smaller than current key")
+        self.update(task_id, entry)
+
+    def update(self, task_id, entry):
+        """Move task_id to the bucket for its new key. O(log b) amortized."""
+        old = self.entries[task_id]
+        if old[0] == entry[0] and old[1] == entry[1]:
+            return
+        del self.entries[task_id]
+        self._leave(old)
+        self.push(entry)
+
+class _SortedKeys:
+    """
+    Sorted list of keys searched with bisect. Keys before self.start are
+    already removed: completing tasks always removes the smallest key, so
+    that case just advances start instead of shifting the whole list.
+
+    Lookups are O(log n), but add and any other remove shift the list
+    (insort / del), which is O(n) memmove per call. That is fast in practice
+    up to around a million keys; past that, random inserts dominate.
+    """
+    __slots__ = ("keys", "start")
+
+    def __init__(self):
+        self.keys = []
+        self.start = 0
+
+    def __len__(self):
+        return len(self.keys) - self.start
+
+    def add(self, key):
+        insort(self.keys, key, self.start)
+
+    def extend(self, keys):
+        self.keys = sorted(self.keys[self.start:] + list(keys))
+        self.start = 0
+
+    def remove(self, key):
+        i = bisect_left(self.keys, key, self.start)
+        if i == len(self.keys) or self.keys[i] != key:
+            raise KeyError(key)
+        if i == self.start:
+            self.start += 1
+            if self.start > 64 and self.start * 2 > len(self.keys):
+                del self.keys[:self.start]
+                self.start = 0
+        else:
+            del self.keys[i]
+
+    def position(self, key):
+        """Index of the first live key >= key."""
+        return bisect_left(self.keys, key, self.start)
+
+class TaskIndex:
+    """
+    Secondary indexes over live tasks, kept in step with the priority queue:
+    - by_deadline: all (deadline, -urgency, task_id) keys in priority order
+    - by_urgency: urgency -> sorted (deadline, task_id) keys
+    Range scans, top-k and counts are O(log n + k) bisects over these lists.
+    Keeping them in step is not free: each add, update and cancel costs an
+    O(n) list shift (see _SortedKeys), on top of the O(log n) queue work.
+    """
+
+    def __init__(self):
+        self.by_deadline = _SortedKeys()
+        self.by_urgency = {}
+
+    def add(self, entry):
+        self.by_deadline.add(entry)
+        day, neg_urgency, task_id = entry
+        keys = self.by_urgency.get(-neg_urgency)
+        if keys is None:
+            keys = self.by_urgency[-neg_urgency] = _SortedKeys()
+        keys.add((day, task_id))
+
+    def extend(self, entries):
+        self.by_deadline.extend(entries)
+        groups = {}
+        for day, neg_urgency, task_id in entries:
+            groups.setdefault(-neg_urgency, []).append((day, task_id))
+        for urgency, keys in groups.items():
+            self.by_urgency.setdefault(urgency, _SortedKeys()).extend(keys)
+
+    def remove(self, entry):
+        self.by_deadline.remove(entry)
+        day, neg_urgency, task_id = entry
+        keys = self.by_urgency[-neg_urgency]
+        keys.remove((day, task_id))
+        if not keys:
+            del self.by_urgency[-neg_urgency]
+
+    def clear(self):
+        self.by_deadline = _SortedKeys()
+        self.by_urgency = {}
+
+    def due_between(self, first_day, last_day):
+        """Task ids with first_day <= deadline <= last_day, in priority order."""
+        index = self.by_deadline
+        lo = index.position((first_day,))
+        hi = index.position((last_day + 1,))
+        return [task_id for _, _, task_id in index.keys[lo:hi]]
+
+    def count_before(self, day):
+        """Number of tasks with deadline < day."""
+        return self.by_deadline.position((day,)) - self.by_deadline.start
+
+    def top_by_deadline(self, k, last_day=None):
+        index = self.by_deadline
+        hi = index.position((last_day + 1,)) if last_day is not None else len(index.keys)
+        return [task_id for _, _, task_id in index.keys[index.start:min(index.start + k, hi)]]
+
+    def top_by_urgency(self, k, last_day=None):
+        """Highest urgency first, then earliest deadline, then lowest id."""
+        result = []
+        for urgency in sorted(self.by_urgency, reverse=True):
+            if len(result) >= k:
+                break
+            index = self.by_urgency[urgency]
+            hi = index.position((last_day + 1,)) if last_day is not None else len(index.keys)
+            stop = min(index.start + k - len(result), hi)
+            result.extend(task_id for _, task_id in index.keys[index.start:stop])
+        return result
+
+class TaskScheduler:
+    task_class = Task  # class used to store task metadata
+
+    def __init__(self, d=2, backend="heap", indexes=False):
+        """
+        backend="heap" uses an indexed d-ary heap (any workload);
+        backend="bucket" uses a BucketQueue (best when deadlines/urgencies repeat).
+        indexes=True maintains a TaskIndex for tasks_due_between/top_k/count_overdue;
+        this makes add/update/cancel O(n) in the worst case (sorted list shifts),
+        so only enable it when those queries are needed.
+        """
+        self.index = TaskIndex() if indexes else None
         self.tasks = {}  # task_id -> Task
-        self.heap = []   # (deadline, -urgency, task_id)
+        if backend == "heap":
+            self.heap = IndexedHeap(d)  # one (deadline, -urgency, task_id) per live task
+        elif backend == "bucket":
+            self.heap = BucketQueue()
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
 
     def add_task(self, task_id, description, deadline, urgency):
         if task_id in self.tasks:
             raise ValueError("Task ID already exists")
-        try:
-            timestamp = datetime.strptime(deadline, "%Y-%m-%d").timestamp()
-        except ValueError:
-            raise ValueError("Invalid deadline format. Use YYYY-MM-DD")
+        day = parse_deadline(deadline)
         if urgency < 0:
             raise ValueError("Urgency must be non-negative")
-        task = Task(task_id, description, timestamp, urgency)
+        task = self.task_class(task_id, description, day, urgency)
         self.tasks[task_id] = task
-        heapq.heappush(self.heap, (timestamp, -urgency, task_id))
+        self.heap.push((day, -urgency, task_id))
+        if self.index is not None:
+            self.index.add((day, -urgency, task_id))
+
+    def add_tasks(self, tasks):
+        """
+        Bulk insert an iterable of (task_id, description, deadline, urgency).
+        Every task is validated before any is inserted, and the heap is
+        built with a single heapify instead of one push per task.
+        """
+        new_tasks = []
+        entries = []
+        seen = set()
+        for task_id, description, deadline, urgency in tasks:
+            if task_id in self.tasks or task_id in seen:
+                raise ValueError("Task ID already exists")
+            day = parse_deadline(deadline)
+            if urgency < 0:
+                raise ValueError("Urgency must be non-negative")
+            seen.add(task_id)
+            new_tasks.append(self.task_class(task_id, description, day, urgency))
+            entries.append((day, -urgency, task_id))
+        for task in new_tasks:
+            self.tasks[task.task_id] = task
+        self.heap.extend(entries)
+        if self.index is not None:
+            self.index.extend(entries)
 
     def get_next_task(self):
-        while self.heap:
-            timestamp, neg_urgency, task_id = self.heap[0]
-            if task_id not in self.tasks or self.tasks[task_id].is_deleted:
-                heapq.heappop(self.heap)  # Remove invalid entry
-            else:
-                return self.tasks[task_id]
-        raise IndexError("No tasks available")
+        _, _, task_id = self.heap.peek()
+        return self.tasks[task_id]
+
+    def _pop_next(self):
+        entry = self.heap.pop()
+        if self.index is not None:
+            self.index.remove(entry)
+        return self.tasks.pop(entry[2])
 
     def complete_task(self):
-        while self.heap:
-            timestamp, neg_urgency, task_id = self.heap[0]
-            if task_id not in self.tasks or self.tasks[task_id].is_deleted:
-                heapq.heappop(self.heap)  # Remove invalid entry
-            else:
-                heapq.heappop(self.heap)
-                task = self.tasks.pop(task_id)
-                return task
-        raise IndexError("No tasks available")
+        return self._pop_next()
+
+    def complete_tasks(self, k):
+        """Remove and return up to k highest-priority tasks, in priority order."""
+        if k >= len(self.heap):
+            return self.drain()
+        return [self._pop_next() for _ in range(max(k, 0))]
+
+    def drain(self):
+        """Remove and return all tasks in priority order."""
+        if self.index is not None:
+            self.index.clear()
+        return [self.tasks.pop(task_id) for _, _, task_id in self.heap.drain()]
 
     def find_task(self, task_id):
-        if task_id not in self.tasks or self.tasks[task_id].is_deleted:
+        if task_id not in self.tasks:
             raise ValueError("Task not found")
         return self.tasks[task_id]
 
     def update_task(self, task_id, new_deadline=None, new_urgency=None):
-        if task_id not in self.tasks or self.tasks[task_id].is_deleted:
+        if task_id not in self.tasks:
             raise ValueError("Task not found")
         task = self.tasks[task_id]
+        deadline = task.deadline
+        urgency = task.urgency
         if new_deadline:
-            try:
-                task.deadline = datetime.strptime(new_deadline, "%Y-%m-%d").timestamp()
-            except ValueError:
-                raise ValueError("Invalid deadline format. Use YYYY-MM-DD")
+            deadline = parse_deadline(new_deadline)
         if new_urgency is not None:
             if new_urgency < 0:
                 raise ValueError("Urgency must be non-negative")
-            task.urgency = new_urgency
-        # Mark old entry as deleted and add new entry
-        task.is_deleted = True
-        heapq.heappush(self.heap, (task.deadline, -task.urgency, task_id))
\ No newline at end of file
+            urgency = new_urgency
+        if self.index is not None:
+            self.index.remove((task.deadline, -task.urgency, task_id))
+            self.index.add((deadline, -urgency, task_id))
+        task.deadline = deadline
+        task.urgency = urgency
+        # Re-position the task's single heap entry in place
+        self.heap.update(task_id, (deadline, -urgency, task_id))
+
+    def cancel_task(self, task_id):
+        if task_id not in self.tasks:
+            raise ValueError("Task not found")
+        entry = self.heap.remove(task_id)
+        if self.index is not None:
+            self.index.remove(entry)
+        return self.tasks.pop(task_id)
+
+    def is_empty(self):
+        return not self.tasks
+
+    def _require_index(self):
+        if self.index is None:
+            raise ValueError("Secondary indexes are disabled. Use TaskScheduler(indexes=True)")
+        return self.index
+
+    def tasks_due_between(self, start, end):
+        """All tasks with start <= deadline <= end (YYYY-MM-DD), in priority order."""
+        index = self._require_index()
+        return [self.tasks[task_id]
+                for task_id in index.due_between(parse_deadline(start), parse_deadline(end))]
+
+    def top_k(self, k, by="urgency", due_by=None):
+        """
+        The k highest-ranked tasks without removing them.
+        by="urgency": highest urgency first, ties by earliest deadline.
+        by="deadline": normal priority order.
+        due_by (YYYY-MM-DD) limits the result to tasks due on or before that day.
+        """
+        index = self._require_index()
+        last_day = parse_deadline(due_by) if due_by is not None else None
+        if by == "urgency":
+            task_ids = index.top_by_urgency(k, last_day)
+        elif by == "deadline":
+            task_ids = index.top_by_deadline(k, last_day)
+        else:
+            raise ValueError("by must be 'urgency' or 'deadline'")
+        return [self.tasks[task_id] for task_id in task_ids]
+
+    def count_overdue(self, now=None):
+        """Number of tasks whose deadline is before now (YYYY-MM-DD, default today)."""
+        index = self._require_index()
+        today = parse_deadline(now) if now is not None else date.today().toordinal() - _EPOCH_ORDINAL
+        return index.count_before(today)
@@ -12,6 +12,9 @@ import heapq
 
 class Task:
     """Represents a single task with its attributes."""
+    # No per-instance __dict__: roughly halves the memory of each Task
+    __slots__ = ("task_id", "description", "deadline", "urgency")
+
     def __init__(self, task_id, description, deadline, urgency):
         self.task_id = task_id
         self.description = description
@@ -37,6 +40,8 @@ class TaskScheduler:
       3) If tie, lower task_id first (to stabilize ordering)
     """
 
+    task_class = Task  # class used to store task metadata
+
     def __init__(self):
         self.tasks = {}   # task_id -> Task
         self.heap = []    # list of tuples: (deadline, -urgency, task_id)
@@ -62,10 +67,34 @@ class TaskScheduler:
         """Add a task to both the dict and the heap. O(1) dict + O(log n) heap."""
         if task_id in self.tasks:
             raise ValueError(f"Task ID {task_id} already exists")
-        task = Task(task_id, description, deadline, urgency)
+        task = self.task_class(task_id, description, deadline, urgency)
         self.tasks[task_id] = task
         self._push(task)
 
+    def add_tasks(self, tasks):
+        """
+        Bulk insert an iterable of (task_id, description, deadline, urgency).
+        All tasks are validated first; the heap is then rebuilt with one
+        O(n) heapify instead of one O(log n) push per task.
+        """
+        new_tasks = []
+        seen = set()
+        for task_id, description, deadline, urgency in tasks:
+            if task_id in self.tasks or task_id in seen:
+                raise ValueError(f"Task ID {task_id} already exists")
+            seen.add(task_id)
+            new_tasks.append(self.task_class(task_id, description, deadline, urgency))
+        for task in new_tasks:
+            self.tasks[task.task_id] = task
+        entries = [(t.deadline, -t.urgency, t.task_id) for t in new_tasks]
+        if len(entries) * 8 < len(self.heap):
+            # Small batch into a large heap: individual pushes are cheaper
+            for entry in entries:
+                heapq.heappush(self.heap, entry)
+        else:
+            self.heap.extend(entries)
+            heapq.heapify(self.heap)
+
     def get_next_task(self):
         """
         Peek the highest-priority task without removing it.
@@ -90,6 +119,27 @@ class TaskScheduler:
         task = self.tasks.pop(task_id)  # O(1) dict deletion
         return task
 
+    def complete_tasks(self, k):
+        """
+        Remove and return up to k highest-priority tasks, in priority order.
+        Stale entries are skipped inline rather than purged on every call.
+        """
+        if k >= len(self.tasks):
+            return self.drain()
+        completed = []
+        while len(completed) < k:
+            _, _, task_id = heapq.heappop(self.heap)
+            task = self.tasks.pop(task_id, None)
+            if task is not None:
+                completed.append(task)
+        return completed
+
+    def drain(self):
+        """Remove and return all tasks in priority order. O(n log n) in C."""
+        entries = sorted(e for e in self.heap if e[2] in self.tasks)
+        self.heap = []
+        return [self.tasks.pop(task_id) for _, _, task_id in entries]
+
     def find_task(self, task_id):
         """Retrieve a task by ID. O(1)."""
         if task_id not in self.tasks:
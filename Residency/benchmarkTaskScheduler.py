@@ -0,0 +1,194 @@
+"""
+Final Group Project - Benchmark Suite
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
+University of the Cumberlands – Kentucky
+
+Reproducible benchmarks for the TaskScheduler implementations.
+
+Every workload is generated from a fixed seed, run once as a warm-up and then
+--repeats times with the garbage collector disabled. Each operation is timed
+with perf_counter_ns, and the median/p95/p99 latency is reported as the
+median over repeats. Peak memory comes from a separate tracemalloc run so
+tracing does not slow down the timed runs. Results can be written as JSON
+and compared against an earlier JSON file to catch regressions.
+
+Example:
+    python benchmarkTaskScheduler.py --sizes 10000 100000 --output run.json
+    python benchmarkTaskScheduler.py --sizes 10000 100000 --compare run.json
+"""
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+import TaskScheduler_final
+import TaskSchedulerPhase3
+
+# The shared benchmark harness lives in the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from benchmark import compare, gc_disabled, load_results, write_json
+
+SCHEDULERS = {
+    "final-heapq": TaskScheduler_final.TaskScheduler,
+    "phase3-heap": lambda: TaskSchedulerPhase3.TaskScheduler(backend="heap"),
+    "phase3-bucket": lambda: TaskSchedulerPhase3.TaskScheduler(backend="bucket"),
+}
+
+# --- Workloads ---
+# Each workload takes (size, seed) and returns (setup, ops): setup is a list
+# of tasks loaded with add_tasks before timing, ops a list of (name, args).
+
+def _deadline(rng, days=31):
+    return f"2025-12-{rng.randint(1, days):02d}"
+
+def insert_heavy(size, seed):
+    rng = random.Random(seed)
+    ops = [("add_task", (i, f"Task {i}", _deadline(rng), rng.randint(1, 10))) for i in range(size)]
+    return [], ops
+
+def update_heavy(size, seed):
+    rng = random.Random(seed)
+    setup = [(i, f"Task {i}", _deadline(rng), rng.randint(1, 10)) for i in range(size)]
+    ops = [("update_task", (rng.randrange(size), _deadline(rng), rng.randint(1, 10)))
+           for _ in range(size)]
+    return setup, ops
+
+def mixed(size, seed):
+    """Half peeks, a quarter completes, a quarter inserts, on a preloaded queue."""
+    rng = random.Random(seed)
+    setup = [(i, f"Task {i}", _deadline(rng), rng.randint(1, 10)) for i in range(size)]
+    ops = []
+    next_id = size
+    for _ in range(size):
+        r = rng.random()
+        if r < 0.5:
+            ops.append(("get_next_task", ()))
+        elif r < 0.75:
+            ops.append(("complete_task", ()))
+        else:
+            ops.append(("add_task", (next_id, f"Task {next_id}", _deadline(rng), rng.randint(1, 10))))
+            next_id += 1
+    return setup, ops
+
+def bursty(size, seed):
+    """90% of tasks land on three days (e.g. end of sprint), then everything is completed."""
+    rng = random.Random(seed)
+    ops = []
+    for i in range(size):
+        deadline = f"2025-12-{rng.choice((5, 12, 19)):02d}" if rng.random() < 0.9 else _deadline(rng)
+        ops.append(("add_task", (i, f"Task {i}", deadline, rng.randint(1, 10))))
+    ops.extend(("complete_task", ()) for _ in range(size))
+    return [], ops
+
+WORKLOADS = {
+    "insert-heavy": insert_heavy,
+    "update-heavy": update_heavy,
+    "mixed": mixed,
+    "bursty": bursty,
+}
+
+# --- Measurement ---
+
+def _prepare(factory, setup):
+    scheduler = factory()
+    if setup:
+        scheduler.add_tasks(setup)
+    return scheduler
+
+def time_ops(factory, setup, ops):
+    """Run ops once with GC off, returning (total seconds, per-op latencies in ns)."""
+    scheduler = _prepare(factory, setup)
+    methods = {name: getattr(scheduler, name) for name in {name for name, _ in ops}}
+    latencies = array("q", bytes(8 * len(ops)))
+    clock = time.perf_counter_ns
+    with gc_disabled():
+        start = clock()
+        for i, (name, args) in enumerate(ops):
+            method = methods[name]
+            t0 = clock()
+            method(*args)
+            latencies[i] = clock() - t0
+        total = clock() - start
+    return total / 1e9, latencies
+
+def peak_memory(factory, setup, ops):
+    """Peak traced bytes while loading the setup and running all ops."""
+    gc.collect()
+    tracemalloc.start()
+    scheduler = _prepare(factory, setup)
+    for name, args in ops:
+        getattr(scheduler, name)(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(int(q * len(sorted_values)), len(sorted_values) - 1)]
+
+def run_case(factory, workload, size, seed, repeats, warmup_size):
+    setup, ops = workload(warmup_size, seed)
+    time_ops(factory, setup, ops)  # warm-up: caches, allocator, branch history
+
+    setup, ops = workload(size, seed)
+    runs = []
+    for _ in range(repeats):
+        total, latencies = time_ops(factory, setup, ops)
+        ordered = sorted(latencies)
+        runs.append({
+            "total_s": total,
+            "median_ns": percentile(ordered, 0.50),
+            "p95_ns": percentile(ordered, 0.95),
+            "p99_ns": percentile(ordered, 0.99),
+        })
+    result = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    result["ops"] = len(ops)
+    result["ops_per_s"] = len(ops) / result["total_s"]
+    result["peak_bytes"] = peak_memory(factory, setup, ops)
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="TaskScheduler benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**4, 10**5])
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--schedulers", nargs="+", choices=list(SCHEDULERS), default=list(SCHEDULERS))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=532)
+    parser.add_argument("--output", type=str, help="write results as JSON")
+    parser.add_argument("--compare", type=str, help="baseline JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':<42} {'ops/s':>12} {'median':>9} {'p95':>9} {'p99':>9} {'peak MB':>9}")
+    for workload_name in args.workloads:
+        for scheduler_name in args.schedulers:
+            factory = SCHEDULERS[scheduler_name]
+            if workload_name == "update-heavy" and not hasattr(factory(), "update_task"):
+                continue  # final scheduler has no update_task
+            for size in args.sizes:
+                key = f"{workload_name}/{scheduler_name}/{size}"
+                result = run_case(factory, WORKLOADS[workload_name], size, args.seed,
+                                  args.repeats, min(size, 10**4))
+                results[key] = result
+                print(f"{key:<42} {result['ops_per_s']:>12,.0f} {result['median_ns']:>7}ns "
+                      f"{result['p95_ns']:>7}ns {result['p99_ns']:>7}ns "
+                      f"{result['peak_bytes'] / 1024 / 1024:>9.2f}")
+
+    if args.output:
+        write_json(args.output, "taskscheduler", results, seed=args.seed, repeats=args.repeats)
+        print(f"Results written to {args.output}")
+    if args.compare:
+        if compare(results, load_results(args.compare), args.threshold, ("median_ns", "p99_ns")):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
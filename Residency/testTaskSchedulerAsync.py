@@ -0,0 +1,73 @@
+"""
+Final Group Project - asyncio Test
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
+University of the Cumberlands – Kentucky
+
+Demonstrates AsyncTaskScheduler with concurrent producer and consumer coroutines.
+"""
+
+import asyncio
+import random
+import time
+from TaskSchedulerAsync import AsyncTaskScheduler
+
+async def run_producer_consumer_test(num_producers=4, num_consumers=3, per_producer=1000):
+    scheduler = AsyncTaskScheduler()
+    total = num_producers * per_producer
+    dispatched = []
+    all_dispatched = asyncio.Event()
+
+    async def producer(p):
+        for start in range(0, per_producer, 100):
+            batch = [
+                (p * per_producer + i, f"Task {i}", f"2025-12-{random.randint(1, 31):02d}",
+                 random.randint(1, 10))
+                for i in range(start, min(start + 100, per_producer))
+            ]
+            scheduler.add_tasks(batch)
+            await asyncio.sleep(0)  # let consumers run between batches
+
+    async def consumer():
+        while True:
+            task = await scheduler.next_task()
+            dispatched.append(task.task_id)
+            if len(dispatched) == total:
+                all_dispatched.set()
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(num_consumers)]
+    start = time.perf_counter()
+    await asyncio.gather(*(producer(p) for p in range(num_producers)))
+    await all_dispatched.wait()
+    elapsed = time.perf_counter() - start
+    for c in consumers:
+        c.cancel()
+
+    assert sorted(dispatched) == list(range(total)), "Task lost or dispatched twice"
+    print(f"Dispatched {total} tasks to {num_consumers} consumers in {elapsed:.4f}s")
+
+async def run_due_task_test():
+    scheduler = AsyncTaskScheduler()
+    scheduler.add_task(1, "Far future", "2999-01-01", 5)
+    try:
+        await asyncio.wait_for(scheduler.due_task(), 0.2)
+        print("Error: future task dispatched early")
+    except asyncio.TimeoutError:
+        print("Future task not yet due (waited without polling)")
+
+    # A task that is already overdue wakes the sleeping waiter immediately
+    waiter = asyncio.create_task(scheduler.due_task())
+    await asyncio.sleep(0.05)
+    scheduler.add_task(2, "Overdue", "2020-01-01", 1)
+    task = await asyncio.wait_for(waiter, 1)
+    print(f"Due task: {task}")
+
+async def main():
+    print("Test Case 1: Concurrent producers and consumers")
+    await run_producer_consumer_test()
+    print("\nTest Case 2: Deadline wakeups")
+    await run_due_task_test()
+
+if __name__ == "__main__":
+    asyncio.run(main())
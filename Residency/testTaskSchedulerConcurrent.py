@@ -0,0 +1,106 @@
+"""
+Final Group Project - Concurrent Stress Test
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80) - Full Term
+University of the Cumberlands – Kentucky
+
+Multi-producer / multi-consumer stress test for ConcurrentTaskScheduler.
+Checks that every task is dispatched exactly once and reports throughput.
+"""
+
+import argparse
+import random
+import threading
+import time
+from TaskSchedulerConcurrent import ConcurrentTaskScheduler
+
+def run_concurrent_stress_test(num_tasks, num_producers, num_workers, num_shards):
+    scheduler = ConcurrentTaskScheduler(num_shards)
+    producers_done = threading.Event()
+    dispatched = [[] for _ in range(num_workers)]
+
+    def producer(start, stop):
+        for i in range(start, stop):
+            deadline = f"2025-12-{random.randint(1, 31):02d}"
+            scheduler.add_task(i, f"Task {i}", deadline, random.randint(1, 10))
+
+    def worker(out):
+        while True:
+            try:
+                out.append(scheduler.complete_task(timeout=0.05).task_id)
+            except IndexError:
+                if producers_done.is_set() and scheduler.is_empty():
+                    return
+
+    chunk = -(-num_tasks // num_producers)
+    producer_threads = [
+        threading.Thread(target=producer, args=(p * chunk, min((p + 1) * chunk, num_tasks)))
+        for p in range(num_producers)
+    ]
+    worker_threads = [threading.Thread(target=worker, args=(out,)) for out in dispatched]
+
+    start = time.perf_counter()
+    for t in worker_threads + producer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    producers_done.set()
+    for t in worker_threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    all_ids = [task_id for out in dispatched for task_id in out]
+    lost = num_tasks - len(set(all_ids))
+    duplicated = len(all_ids) - len(set(all_ids))
+    return elapsed, lost, duplicated
+
+def run_batch_rejection_test(num_shards):
+    """A batch with a duplicate ID must be rejected whole, with no permits released."""
+    scheduler = ConcurrentTaskScheduler(num_shards)
+    scheduler.add_task(100, "Existing", "2025-12-01", 1)
+    batches = [
+        [(i, f"Task {i}", "2025-12-01", 1) for i in range(8)] + [(7, "Duplicate", "2025-12-02", 2)],
+        [(i, f"Task {i}", "2025-12-01", 1) for i in range(8)] + [(100, "Existing", "2025-12-02", 2)],
+    ]
+    for batch in batches:
+        try:
+            scheduler.add_tasks(batch)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for a duplicate ID")
+        assert len(scheduler) == 1, "Rejected batch left tasks behind"
+    assert scheduler.complete_task(block=False).task_id == 100
+    try:
+        scheduler.complete_task(block=False)
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("Rejected batch released permits")
+    scheduler.add_tasks(batches[0][:-1])
+    assert len(scheduler) == 8, "Valid batch was not inserted"
+    print("Batch rejection test passed")
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent Task Scheduler stress test")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--shards", type=int, default=8)
+    args = parser.parse_args()
+
+    run_batch_rejection_test(args.shards)
+    failed = False
+    for num_workers in args.workers:
+        elapsed, lost, duplicated = run_concurrent_stress_test(
+            args.tasks, args.producers, num_workers, args.shards)
+        status = "OK" if lost == 0 and duplicated == 0 else "FAILED"
+        failed = failed or status == "FAILED"
+        print(f"{num_workers} workers: {args.tasks / elapsed:,.0f} tasks/s, "
+              f"lost={lost}, duplicated={duplicated} [{status}]")
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
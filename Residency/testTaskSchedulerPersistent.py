@@ -0,0 +1,159 @@
+"""
+Final Group Project - Persistence Test
+Bereket Gebremariam, Sachin Karki
+Satish Penmatsa
+2025 Fall - Algorithms and Data Structures (MSCS-532-M80)
+University of the Cumberlands – Kentucky
+
+Crash-recovery check and durability benchmark for PersistentTaskScheduler.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from TaskSchedulerPersistent import PersistentTaskScheduler
+
+def random_deadline():
+    return f"2025-12-{random.randint(1, 31):02d}"
+
+def state_of(scheduler):
+    return sorted((t.task_id, t.description, t.deadline, t.urgency) for t in scheduler.tasks.values())
+
+def run_recovery_test(directory, num_ops=20000):
+    """Random add/update/complete/cancel with snapshots, then a simulated crash."""
+    scheduler = PersistentTaskScheduler(directory, snapshot_every=5000)
+    next_id = 0
+    for _ in range(num_ops):
+        op = random.random()
+        if op < 0.5 or not scheduler.tasks:
+            scheduler.add_task(next_id, f"Task {next_id}", random_deadline(), random.randint(1, 10))
+            next_id += 1
+        elif op < 0.7:
+            task_id = random.choice(list(scheduler.tasks))
+            scheduler.update_task(task_id, random_deadline(), random.randint(0, 10))
+        elif op < 0.9:
+            scheduler.complete_task()
+        else:
+            scheduler.cancel_task(random.choice(list(scheduler.tasks)))
+    scheduler.sync()
+    expected = state_of(scheduler)
+    expected_next = scheduler.get_next_task().task_id
+
+    # Simulate a crash mid-write: leave a torn record at the end of the log
+    log_path = scheduler.log_path
+    scheduler.close()
+    with open(log_path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    recovered = PersistentTaskScheduler(directory)
+    assert state_of(recovered) == expected, "Recovered state differs"
+    assert recovered.get_next_task().task_id == expected_next, "Recovered order differs"
+    recovered.close()
+    print(f"Recovery test passed: {len(expected)} live tasks after {num_ops} operations")
+
+def run_process_crash_test(directory, num_tasks=10):
+    """
+    Kill a child process right after a few add_task calls, with no sync()
+    or close(); every acknowledged task must still be there on recovery.
+    """
+    child = (
+        "import os, sys\n"
+        "from TaskSchedulerPersistent import PersistentTaskScheduler\n"
+        "scheduler = PersistentTaskScheduler(sys.argv[1])\n"
+        "for i in range(int(sys.argv[2])):\n"
+        "    scheduler.add_task(i, f'Task {i}', '2025-12-01', i % 10)\n"
+        "scheduler.update_task(0, new_urgency=42)\n"
+        "scheduler.cancel_task(1)\n"
+        "os._exit(0)\n"
+    )
+    subprocess.run([sys.executable, "-c", child, directory, str(num_tasks)], check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)))
+    recovered = PersistentTaskScheduler(directory)
+    assert sorted(recovered.tasks) == [0] + list(range(2, num_tasks)), "Acknowledged tasks were lost"
+    assert recovered.find_task(0).urgency == 42, "Acknowledged update was lost"
+    recovered.close()
+    print(f"Process crash test passed: {num_tasks - 1} tasks recovered without sync()")
+
+def run_rejection_test(directory):
+    """Operations that cannot be logged must fail without changing memory or the log."""
+    scheduler = PersistentTaskScheduler(directory)
+    scheduler.add_tasks([(i, f"Task {i}", random_deadline(), random.randint(1, 10)) for i in range(100)])
+    scheduler.sync()
+    expected = state_of(scheduler)
+    log_size = os.path.getsize(scheduler.log_path)
+
+    bad_calls = [
+        lambda: scheduler.add_task(100, "Too urgent", "2025-12-01", 2**40),
+        lambda: scheduler.add_task("abc", "Not an integer ID", "2025-12-01", 1),
+        lambda: scheduler.add_tasks([(100, "Fine", "2025-12-01", 1), (101, "Too urgent", "2025-12-01", 2**40)]),
+        lambda: scheduler.update_task(5, new_urgency=2**40),
+        lambda: scheduler.update_task(5, "2025-13-01"),
+        lambda: scheduler.cancel_task(1000),
+    ]
+    for call in bad_calls:
+        try:
+            call()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError")
+        assert state_of(scheduler) == expected, "Rejected operation changed memory"
+    scheduler.sync()
+    assert os.path.getsize(scheduler.log_path) == log_size, "Rejected operation was logged"
+    scheduler.close()
+
+    recovered = PersistentTaskScheduler(directory)
+    assert state_of(recovered) == expected, "Recovered state differs"
+    recovered.close()
+    print(f"Rejection test passed: {len(bad_calls)} invalid operations left no trace")
+
+def run_durability_benchmark(directory, num_tasks):
+    tasks = [(i, f"Task {i}", random_deadline(), random.randint(1, 10)) for i in range(num_tasks)]
+
+    scheduler = PersistentTaskScheduler(directory, snapshot_every=num_tasks * 2)
+    start = time.perf_counter()
+    for task in tasks:
+        scheduler.add_task(*task)
+    scheduler.sync()
+    elapsed = time.perf_counter() - start
+    print(f"Durable add_task: {num_tasks / elapsed:,.0f} ops/s "
+          f"(group commit every {scheduler.group_size} ops)")
+
+    start = time.perf_counter()
+    scheduler.snapshot()
+    print(f"Snapshot of {num_tasks} tasks: {time.perf_counter() - start:.3f}s, "
+          f"{os.path.getsize(scheduler.snapshot_path) / num_tasks:.1f} bytes/task")
+
+    # Add a log tail of updates on top of the snapshot
+    tail = num_tasks // 10
+    for task_id in random.sample(range(num_tasks), tail):
+        scheduler.update_task(task_id, random_deadline(), random.randint(0, 10))
+    scheduler.close()
+
+    start = time.perf_counter()
+    recovered = PersistentTaskScheduler(directory)
+    elapsed = time.perf_counter() - start
+    print(f"Recovery of {len(recovered.tasks)} tasks (snapshot + {tail} log records): {elapsed:.3f}s")
+    recovered.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent Task Scheduler test")
+    parser.add_argument("--tasks", type=int, default=10**6)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="taskscheduler-")
+    try:
+        run_recovery_test(os.path.join(directory, "recovery"))
+        run_process_crash_test(os.path.join(directory, "crash"))
+        run_rejection_test(os.path.join(directory, "rejection"))
+        run_durability_benchmark(os.path.join(directory, "bench"), args.tasks)
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    main()
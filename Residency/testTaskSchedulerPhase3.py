@@ -13,16 +13,31 @@ import time
 import psutil
 import os
 import random
+import tracemalloc
 import matplotlib.pyplot as plt
 from TaskScheduler_final import TaskScheduler
+import TaskSchedulerPhase3
+from TaskSchedulerPersistent import PersistentTaskScheduler
+
+class LegacyTask:
+    """Task layout before __slots__ (one __dict__ per task), kept as a memory baseline."""
+    def __init__(self, task_id, description, deadline, urgency):
+        self.task_id = task_id
+        self.description = description
+        self.deadline = deadline
+        self.urgency = urgency
+
+class LegacyTaskScheduler(TaskScheduler):
+    task_class = LegacyTask
 
 def measure_performance(func):
+    """Quick single-run numbers for the CLI; see benchmarkTaskScheduler.py for real benchmarks."""
     def wrapper(*args, **kwargs):
-        start_time = time.time()
         process = psutil.Process(os.getpid())
         start_memory = process.memory_info().rss / 1024 / 1024
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         end_memory = process.memory_info().rss / 1024 / 1024
         return result, (end_time - start_time), (end_memory - start_memory)
     return wrapper
@@ -78,17 +93,30 @@ def run_edge_case_tests():
 def run_stress_test(num_tasks):
     scheduler = TaskScheduler()
     print(f"\nStress testing with {num_tasks} tasks...")
-    for i in range(num_tasks):
-        deadline = f"2025-12-{random.randint(1, 31):02d}"
-        scheduler.add_task(i, f"Task {i}", deadline, random.randint(1, 10))
+    scheduler.add_tasks(
+        (i, f"Task {i}", f"2025-12-{random.randint(1, 31):02d}", random.randint(1, 10))
+        for i in range(num_tasks)
+    )
     completed = 0
-    while scheduler.heap:
-        scheduler.complete_task()
-        completed += 1
-        if completed % (num_tasks // 10) == 0:
-            print(f"Completed {completed} tasks")
+    batch = max(num_tasks // 10, 1)
+    while not scheduler.is_empty():
+        completed += len(scheduler.complete_tasks(batch))
+        print(f"Completed {completed} tasks")
     return f"Stress test with {num_tasks} tasks completed"
 
+def measure_bytes_per_task(scheduler_cls, num_tasks):
+    """Heap + dict + Task bytes per task, traced by tracemalloc (input tuples excluded)."""
+    tasks = [
+        (i, f"Task {i}", f"2025-12-{random.randint(1, 31):02d}", random.randint(1, 10))
+        for i in range(num_tasks)
+    ]
+    tracemalloc.start()
+    scheduler = scheduler_cls()
+    scheduler.add_tasks(tasks)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / num_tasks
+
 @measure_performance
 def cli_find_task(scheduler, task_id):
     try:
@@ -97,6 +125,35 @@ def cli_find_task(scheduler, task_id):
         print(f"Error: {e}")
     return "Find task executed"
 
+def compare_backends(num_tasks):
+    """
+    Time insert + pop-min for the heapq scheduler and both Phase 3 backends
+    on the same stress-test workload. Returns {backend: (insert s, pop s)}.
+    """
+    tasks = [
+        (i, f"Task {i}", f"2025-12-{random.randint(1, 31):02d}", random.randint(1, 10))
+        for i in range(num_tasks)
+    ]
+    factories = {
+        "heapq": TaskScheduler,
+        "indexed heap": lambda: TaskSchedulerPhase3.TaskScheduler(backend="heap"),
+        "bucket queue": lambda: TaskSchedulerPhase3.TaskScheduler(backend="bucket"),
+    }
+    results = {}
+    for name, factory in factories.items():
+        scheduler = factory()
+        start = time.perf_counter()
+        for task in tasks:
+            scheduler.add_task(*task)
+        insert_time = time.perf_counter() - start
+        start = time.perf_counter()
+        while not scheduler.is_empty():
+            scheduler.complete_task()
+        pop_time = time.perf_counter() - start
+        results[name] = (insert_time, pop_time)
+        del scheduler
+    return results
+
 def plot_performance(sizes, times, memories, filename="performance.png"):
     plt.figure(figsize=(10, 5))
     plt.subplot(1, 2, 1)
@@ -131,12 +188,21 @@ def main():
     parser_find = subparsers.add_parser("find")
     parser_find.add_argument("--task_id", type=int, required=True)
 
-    subparsers.add_parser("next")
+    parser_next = subparsers.add_parser("next")
+    for sub in (parser_add, parser_find, parser_next):
+        sub.add_argument("--state", type=str, default=None,
+                         help="directory for durable state (log + snapshot) kept between runs")
     subparsers.add_parser("test")
     subparsers.add_parser("stress")
+    parser_backends = subparsers.add_parser("backends")
+    parser_backends.add_argument("--sizes", type=int, nargs="+",
+                                 default=[10**4, 10**5, 10**6, 10**7])
 
     args = parser.parse_args()
-    scheduler = TaskScheduler()
+    if getattr(args, "state", None):
+        scheduler = PersistentTaskScheduler(args.state)
+    else:
+        scheduler = TaskScheduler()
 
     if args.command == "add":
         try:
@@ -165,9 +231,20 @@ def main():
             print(f"{result}: Time: {time_taken:.4f}s, Memory: {memory_used:.4f}MB")
             times.append(time_taken)
             memories.append(memory_used)
+            before = measure_bytes_per_task(LegacyTaskScheduler, size)
+            after = measure_bytes_per_task(TaskScheduler, size)
+            print(f"Bytes per task: {before:.1f} B before (__dict__), {after:.1f} B after (__slots__)")
         plot_performance(sizes, times, memories)
+    elif args.command == "backends":
+        for size in args.sizes:
+            print(f"\nBackend comparison with {size} tasks:")
+            for name, (insert_time, pop_time) in compare_backends(size).items():
+                print(f"  {name:<12} insert: {insert_time / size * 1e9:8.1f} ns/task, "
+                      f"pop: {pop_time / size * 1e9:8.1f} ns/task")
     else:
         parser.print_help()
+    if isinstance(scheduler, PersistentTaskScheduler):
+        scheduler.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
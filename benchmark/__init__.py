@@ -0,0 +1,10 @@
+"""
+Shared benchmark harness used by the sorting, scheduler and particle
+experiment scripts: seeded datasets, low-overhead timing, summary
+statistics and JSON/CSV export with baseline comparison.
+"""
+
+from .datasets import DATASETS, make_datasets
+from .stats import reject_outliers, summarize
+from .harness import Suite, gc_disabled, measure, peak_memory, time_call
+from .results import compare, environment, load_results, write_csv, write_json
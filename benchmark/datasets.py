@@ -0,0 +1,41 @@
+# Bereket Gebremariam
+# Seeded dataset generators shared by the sorting experiments
+
+import random
+
+def random_data(n, seed):
+    rng = random.Random(seed)
+    return [rng.randint(0, n) for _ in range(n)]
+
+def sorted_data(n, seed):
+    return list(range(n))
+
+def reverse_sorted_data(n, seed):
+    return list(range(n, 0, -1))
+
+def few_unique_data(n, seed, keys=300):
+    """Low-cardinality keys, like real production data."""
+    rng = random.Random(seed)
+    return [rng.randint(0, keys - 1) for _ in range(n)]
+
+def nearly_sorted_data(n, seed, swaps=None):
+    """Sorted data with about 1% of positions swapped at random."""
+    rng = random.Random(seed)
+    data = list(range(n))
+    for _ in range(max(n // 100, 1) if swaps is None else swaps):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+DATASETS = {
+    "Random Data": random_data,
+    "Sorted Data": sorted_data,
+    "Reverse Sorted Data": reverse_sorted_data,
+    "Few Unique Data": few_unique_data,
+    "Nearly Sorted Data": nearly_sorted_data,
+}
+
+def make_datasets(n, seed=532, names=None):
+    """Build the named datasets of size n; the same seed gives the same data."""
+    names = list(DATASETS) if names is None else names
+    return {name: DATASETS[name](n, seed) for name in names}
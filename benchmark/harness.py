@@ -0,0 +1,103 @@
+# Bereket Gebremariam
+# Low-overhead timing and memory measurement
+
+import gc
+import time
+import tracemalloc
+from contextlib import contextmanager
+from .stats import summarize
+from .results import compare, load_results, write_csv, write_json
+
+@contextmanager
+def gc_disabled():
+    """Keep the cyclic garbage collector from pausing inside a timed region."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def time_call(func, setup=None, repeats=5, warmup=1):
+    """
+    Time func with perf_counter_ns, returning one sample (ns) per repeat.
+    If setup is given it is called untimed before every run and its result
+    is passed to func, e.g. setup=lambda: data.copy() so each run sorts
+    fresh input. The first warmup runs are discarded.
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    for i in range(warmup + repeats):
+        arg = setup() if setup is not None else None
+        with gc_disabled():
+            if setup is not None:
+                start = clock()
+                func(arg)
+                elapsed = clock() - start
+            else:
+                start = clock()
+                func()
+                elapsed = clock() - start
+        if i >= warmup:
+            samples.append(elapsed)
+        del arg
+    return samples
+
+def peak_memory(func, setup=None):
+    """
+    Peak bytes allocated by one run of func, traced with tracemalloc.
+    Tracing starts after setup, so the input copy is not counted.
+    """
+    arg = setup() if setup is not None else None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        if setup is not None:
+            func(arg)
+        else:
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def measure(func, setup=None, repeats=5, warmup=1, memory=True, reject=True):
+    """time_call + summarize, plus the tracemalloc peak from a separate run."""
+    result = summarize(time_call(func, setup, repeats, warmup), reject)
+    if memory:
+        result["peak_bytes"] = peak_memory(func, setup)
+    return result
+
+
+class Suite:
+    """
+    A named set of benchmark cases. Scripts either run cases through the
+    harness with run() or record metrics they measured themselves, then
+    save() the results and compare() them against a stored baseline.
+    """
+
+    def __init__(self, name, **defaults):
+        self.name = name
+        self.defaults = defaults  # default measure() options
+        self.results = {}
+
+    def run(self, case, func, setup=None, **options):
+        result = measure(func, setup, **{**self.defaults, **options})
+        self.results[case] = result
+        return result
+
+    def record(self, case, metrics):
+        self.results[case] = dict(metrics)
+        return self.results[case]
+
+    def save(self, path):
+        """Write results as CSV if path ends in .csv, otherwise as JSON."""
+        if path.endswith(".csv"):
+            write_csv(path, self.results)
+        else:
+            write_json(path, self.name, self.results)
+
+    def compare(self, baseline_path, threshold=0.10, metrics=("median_ns",)):
+        """Print regressions against a saved JSON baseline; returns their count."""
+        return compare(self.results, load_results(baseline_path), threshold, metrics)
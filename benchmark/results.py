@@ -0,0 +1,44 @@
+# Bereket Gebremariam
+# Result export and baseline regression checks
+
+import csv
+import json
+import platform
+import sys
+
+def environment():
+    return {"python": sys.version, "platform": platform.platform()}
+
+def write_json(path, name, results, **extra):
+    with open(path, "w") as f:
+        json.dump({"suite": name, **environment(), **extra, "results": results}, f, indent=2)
+
+def write_csv(path, results):
+    """One row per case; columns are the union of all metric names."""
+    columns = []
+    for metrics in results.values():
+        columns.extend(key for key in metrics if key not in columns)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["case"] + columns)
+        for case, metrics in results.items():
+            writer.writerow([case] + [metrics.get(key, "") for key in columns])
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def compare(results, baseline, threshold=0.10, metrics=("median_ns",)):
+    """Print cases whose metrics grew by more than threshold; returns the count."""
+    regressions = 0
+    for case, current in results.items():
+        old = baseline.get(case)
+        if old is None:
+            continue
+        for metric in metrics:
+            if old.get(metric) and current.get(metric, 0) > old[metric] * (1 + threshold):
+                change = current[metric] / old[metric] - 1
+                print(f"REGRESSION {case} {metric}: {old[metric]:.0f} -> {current[metric]:.0f} (+{change:.0%})")
+                regressions += 1
+    print(f"{regressions} regression(s) against baseline (threshold {threshold:.0%})")
+    return regressions
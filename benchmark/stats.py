@@ -0,0 +1,58 @@
+# Bereket Gebremariam
+# Summary statistics for repeated timing samples
+
+import math
+import statistics
+
+# Two-sided 95% Student t critical values by degrees of freedom; larger
+# samples use the normal value
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056,
+    27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+}
+_Z_95 = 1.960
+
+def quantile(sorted_values, q):
+    """Linear-interpolated quantile of an already sorted list."""
+    pos = (len(sorted_values) - 1) * q
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+def reject_outliers(samples, k=1.5):
+    """
+    Drop samples outside Tukey's fences [Q1 - k*IQR, Q3 + k*IQR], e.g. a run
+    hit by a context switch. Returns (kept, rejected count). Fewer than four
+    samples are returned unchanged.
+    """
+    if len(samples) < 4:
+        return list(samples), 0
+    ordered = sorted(samples)
+    q1, q3 = quantile(ordered, 0.25), quantile(ordered, 0.75)
+    low, high = q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+    kept = [x for x in samples if low <= x <= high]
+    return kept, len(samples) - len(kept)
+
+def summarize(samples, reject=True):
+    """
+    Mean, median, spread and a 95% confidence interval half-width (Student t)
+    of timing samples in nanoseconds, after optional outlier rejection.
+    """
+    kept, rejected = reject_outliers(samples) if reject else (list(samples), 0)
+    n = len(kept)
+    mean = statistics.fmean(kept)
+    stdev = statistics.stdev(kept) if n > 1 else 0.0
+    ci = _T_95.get(n - 1, _Z_95) * stdev / math.sqrt(n) if n > 1 else 0.0
+    return {
+        "samples": n,
+        "rejected": rejected,
+        "mean_ns": mean,
+        "median_ns": statistics.median(kept),
+        "stdev_ns": stdev,
+        "ci95_ns": ci,
+        "min_ns": min(kept),
+        "max_ns": max(kept),
+    }
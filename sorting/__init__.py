@@ -0,0 +1,18 @@
+"""
+Shared sorting engines used by the sorting experiment scripts
+("Merge and quick sort.py" and "Assignment 5/...Empirical Analysis.py").
+"""
+
+from .introsort import heapsort, insertion_sort, introsort
+from .threeway import partition3, quicksort_3way
+from .mergesort import natural_merge_sort
+from .selection import partial_sort, quickselect, top_k
+from .adaptive import adaptive_sort, choose_strategy
+from .instrumented import SortStats
+
+try:
+    from .vectorized import radix_sort, vectorized_quicksort
+    from .parallel import parallel_sort
+    from .external import external_sort
+except ImportError:  # NumPy is only needed for the array-based backends
+    pass
@@ -0,0 +1,110 @@
+# Bereket Gebremariam
+# Adaptive sort: sample the input, then dispatch to the engine that suits it
+
+import random
+from collections import namedtuple
+from .introsort import insertion_sort, introsort
+from .mergesort import MIN_RUN, natural_merge_sort
+from .threeway import quicksort_3way
+
+# Inputs this small go straight to insertion sort
+SMALL_INPUT = 32
+# Up to this size, a sample without inversions is trusted for insertion sort
+PRESORTED_INPUT = 1024
+# Number of random probes used for each estimate
+SAMPLE_SIZE = 256
+# Integer keys with a value range up to this many times n use counting sort
+COUNTING_RANGE_FACTOR = 4
+# A sample with fewer than this fraction of distinct keys is "duplicate heavy"
+DUPLICATE_RATIO = 0.5
+
+Strategy = namedtuple("Strategy", ["name", "reason", "stats"])
+
+def sample_stats(arr, sample_size=SAMPLE_SIZE):
+    """
+    Cheap estimates of the structure of arr from random probes, O(sample_size)
+    except for the min/max scan that is only done for integer samples:
+      descents   - fraction of adjacent pairs with arr[i] > arr[i+1]
+      inversions - fraction of random pairs (i < j) with arr[i] > arr[j]
+      distinct   - distinct keys / probes in a random sample
+      span       - max - min + 1 for integer keys, else None
+    """
+    n = len(arr)
+    probes = min(sample_size, n - 1)
+    descents = sum(arr[i] > arr[i + 1] for i in (random.randrange(n - 1) for _ in range(probes)))
+    inversions = 0
+    for _ in range(probes):
+        i, j = random.randrange(n), random.randrange(n)
+        if i > j:
+            i, j = j, i
+        inversions += arr[i] > arr[j]
+    sample = [arr[random.randrange(n)] for _ in range(probes)]
+    span = None
+    if all(type(x) is int for x in sample):
+        span = max(arr) - min(arr) + 1
+    return {
+        "n": n,
+        "descents": descents / probes,
+        "inversions": inversions / probes,
+        "distinct": len(set(sample)) / probes,
+        "span": span,
+    }
+
+def choose_strategy(arr):
+    """Pick a sorting engine for arr without modifying it; returns a Strategy."""
+    n = len(arr)
+    if n <= SMALL_INPUT:
+        return Strategy("insertion", f"small input (n={n})", {"n": n})
+    stats = sample_stats(arr)
+    # Expected number of natural runs if descents are spread evenly
+    runs = stats["descents"] * n + 1
+    if stats["inversions"] == 0 and n <= PRESORTED_INPUT:
+        return Strategy("insertion", "no inversions found in sample", stats)
+    if runs <= n / MIN_RUN or stats["descents"] >= 1 - 1 / MIN_RUN:
+        return Strategy("natural_merge",
+                        f"long runs (~{stats['descents']:.1%} descents)", stats)
+    if stats["span"] is not None and stats["span"] <= COUNTING_RANGE_FACTOR * n:
+        return Strategy("counting", f"integer keys in a range of {stats['span']}", stats)
+    if stats["distinct"] < DUPLICATE_RATIO:
+        return Strategy("3way_quick",
+                        f"duplicate heavy (~{stats['distinct']:.0%} distinct in sample)", stats)
+    return Strategy("introsort", "no exploitable structure", stats)
+
+def counting_sort(arr):
+    """Sorts a list of integers in place in O(n + range)."""
+    if not arr:
+        return
+    lowest = min(arr)
+    counts = [0] * (max(arr) - lowest + 1)
+    for x in arr:
+        counts[x - lowest] += 1
+    i = 0
+    for value, count in enumerate(counts, lowest):
+        if count:
+            arr[i:i + count] = [value] * count
+            i += count
+
+def adaptive_sort(arr):
+    """
+    Sorts the list arr in place with the engine choose_strategy() picks:
+    insertion sort for tiny or presorted-looking input, natural merge sort
+    for long runs (ascending or descending), counting sort for integers in
+    a small range, 3-way quicksort for duplicate-heavy data and introsort
+    otherwise. Returns the Strategy, so callers can log what ran and why.
+    """
+    strategy = choose_strategy(arr)
+    if strategy.name == "insertion":
+        insertion_sort(arr, 0, len(arr) - 1)
+    elif strategy.name == "natural_merge":
+        natural_merge_sort(arr)
+    elif strategy.name == "counting":
+        try:
+            counting_sort(arr)
+        except TypeError:  # a non-integer key the sample missed; arr is untouched
+            strategy = Strategy("introsort", "non-integer key found", strategy.stats)
+            introsort(arr, 0, len(arr) - 1)
+    elif strategy.name == "3way_quick":
+        quicksort_3way(arr, 0, len(arr) - 1)
+    else:
+        introsort(arr, 0, len(arr) - 1)
+    return strategy
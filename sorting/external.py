@@ -0,0 +1,129 @@
+# Bereket Gebremariam
+# External (out-of-core) sort for binary files larger than RAM
+
+import heapq
+import os
+import shutil
+import tempfile
+import numpy as np
+from .introsort import introsort
+from .mergesort import natural_merge_sort
+
+# Rough in-memory cost per element when a run is sorted as a Python list
+# (list slot + int object + merge buffer slot), used to size runs
+_PYTHON_BYTES_PER_ITEM = 80
+_MIN_BLOCK_ITEMS = 1024
+
+def _sort_run(values, engine):
+    if engine == "numpy":
+        values.sort()
+        return values
+    items = values.tolist()
+    if engine == "merge":
+        natural_merge_sort(items)
+    else:
+        introsort(items, 0, len(items) - 1)
+    return np.array(items, dtype=values.dtype)
+
+def _make_runs(input_path, run_dir, dtype, run_items, engine):
+    """Read input_path run_items at a time, sort each run, spill it to run_dir."""
+    paths = []
+    with open(input_path, "rb") as f:
+        while True:
+            values = np.fromfile(f, dtype=dtype, count=run_items)
+            if len(values) == 0:
+                break
+            path = os.path.join(run_dir, f"run_{len(paths):05d}.bin")
+            _sort_run(values, engine).tofile(path)
+            paths.append(path)
+            del values
+    return paths
+
+def _merge_runs(paths, output_path, dtype, block_items):
+    """
+    K-way merge of sorted run files into output_path.
+
+    Each run is memory-mapped and read block_items at a time. A heap keyed
+    by the last value of each run's current block gives the smallest such
+    value, the bound. Every value <= bound in any loaded block is known to
+    come before everything not yet loaded, so those pieces are merged
+    together and written out. The run that set the bound is then empty and
+    gets its next block.
+    """
+    runs = [np.memmap(path, dtype=dtype, mode="r") for path in paths if os.path.getsize(path)]
+    blocks = []
+    positions = []
+    generation = [0] * len(runs)
+    heap = []
+
+    def refill(r):
+        start = positions[r]
+        block = np.array(runs[r][start:start + block_items])  # one buffered read
+        positions[r] = start + len(block)
+        blocks[r] = block
+        if len(block):
+            generation[r] += 1
+            heapq.heappush(heap, (block[-1], r, generation[r]))
+
+    for r in range(len(runs)):
+        blocks.append(None)
+        positions.append(0)
+        refill(r)
+
+    try:
+        with open(output_path, "wb", buffering=1 << 20) as out:
+            while heap:
+                bound, r, gen = heapq.heappop(heap)
+                if gen != generation[r] or len(blocks[r]) == 0:
+                    continue  # stale entry: run r was refilled or drained since
+                pieces = []
+                for i, block in enumerate(blocks):
+                    if len(block):
+                        cut = int(np.searchsorted(block, bound, side="right"))
+                        if cut:
+                            pieces.append(block[:cut])
+                            blocks[i] = block[cut:]
+                merged = np.concatenate(pieces) if len(pieces) > 1 else pieces[0].copy()
+                if len(pieces) > 1:
+                    merged.sort()  # merges the already-sorted pieces
+                out.write(memoryview(merged))
+                for i, block in enumerate(blocks):
+                    if len(block) == 0 and positions[i] < len(runs[i]):
+                        refill(i)
+    finally:
+        runs.clear()  # drop the memmaps so the run files can be removed
+
+def external_sort(input_path, output_path, memory_budget=64 * 1024 * 1024,
+                  dtype=np.int64, engine="numpy", tmp_dir=None):
+    """
+    Sorts a raw binary file of dtype values (as written by ndarray.tofile)
+    into output_path, using about memory_budget bytes of RAM whatever the
+    file size.
+
+    Phase 1 reads runs that fit in the budget, sorts each one in memory
+    (engine: "numpy", "merge" or "introsort") and spills it to a temporary
+    binary file. Phase 2 k-way merges the runs through memory-mapped,
+    block-buffered reads (see _merge_runs). Returns the number of runs.
+    """
+    dtype = np.dtype(dtype)
+    if engine == "numpy":
+        run_items = memory_budget // (2 * dtype.itemsize)
+    else:
+        run_items = memory_budget // _PYTHON_BYTES_PER_ITEM
+    run_items = max(run_items, _MIN_BLOCK_ITEMS)
+
+    run_dir = tempfile.mkdtemp(prefix="extsort-", dir=tmp_dir)
+    try:
+        paths = _make_runs(input_path, run_dir, dtype, run_items, engine)
+        if len(paths) <= 1:
+            if paths:
+                shutil.copyfile(paths[0], output_path)
+            else:
+                open(output_path, "wb").close()
+            return len(paths)
+        # Loaded blocks plus one merged batch must fit in the budget
+        block_items = max(memory_budget // (3 * len(paths) * dtype.itemsize), _MIN_BLOCK_ITEMS)
+        _merge_runs(paths, output_path, dtype, block_items)
+        return len(paths)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
@@ -0,0 +1,53 @@
+# Bereket Gebremariam
+# Counters for the instrumented sort variants in the experiment scripts
+
+# Partition balance is bucketed by the smaller side's share of the
+# segment: bin 0 holds splits worse than 5/95, bin 9 near-perfect halves
+IMBALANCE_BINS = 10
+# Segments smaller than this are left out of the histogram (a 2-element
+# segment always splits 0/1)
+IMBALANCE_MIN_SIZE = 16
+
+class SortStats:
+    """
+    Comparison, swap/move, partition-balance and depth counters filled in by
+    the counted_* sort variants. Those variants are separate functions, so
+    the normal sorts carry no instrumentation cost at all.
+    """
+
+    __slots__ = ("comparisons", "swaps", "moves", "partitions", "imbalance", "max_depth")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.partitions = 0
+        self.imbalance = [0] * IMBALANCE_BINS
+        self.max_depth = 0
+
+    def record_partition(self, left, right):
+        """Count one partition step that left `left` and `right` elements on each side."""
+        self.partitions += 1
+        total = left + right
+        if total >= IMBALANCE_MIN_SIZE:
+            share = min(left, right) / total  # 0 (degenerate) .. 0.5 (perfect)
+            self.imbalance[min(int(share * 2 * IMBALANCE_BINS), IMBALANCE_BINS - 1)] += 1
+
+    def record_depth(self, depth):
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def degenerate_share(self):
+        """Fraction of histogrammed partitions in the worst bin (smaller side < 5%)."""
+        binned = sum(self.imbalance)
+        return self.imbalance[0] / binned if binned else 0.0
+
+    def as_dict(self):
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "moves": self.moves,
+            "partitions": self.partitions,
+            "imbalance": list(self.imbalance),
+            "max_depth": self.max_depth,
+        }
@@ -0,0 +1,94 @@
+# Bereket Gebremariam
+# Non-recursive introsort engine
+
+import math
+
+# Ranges this small are finished with insertion sort
+INSERTION_THRESHOLD = 16
+
+def insertion_sort(arr, low, high):
+    """Sorts arr[low..high] (inclusive) in place."""
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+def _sift_down(arr, base, root, size):
+    """Max-heap sift-down for the heap stored in arr[base:base + size]."""
+    item = arr[base + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[base + child + 1] > arr[base + child]:
+            child += 1
+        if arr[base + child] <= item:
+            break
+        arr[base + root] = arr[base + child]
+        root = child
+        child = 2 * root + 1
+    arr[base + root] = item
+
+def heapsort(arr, low, high):
+    """Sorts arr[low..high] (inclusive) in place. O(n log n) worst case, no recursion."""
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+def partition(arr, low, high):
+    """Median-of-three Lomuto partition (same scheme as "Merge and quick sort.py")."""
+    mid = (low + high) // 2
+    if arr[low] > arr[mid]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+    if arr[low] > arr[high]:
+        arr[low], arr[high] = arr[high], arr[low]
+    if arr[mid] > arr[high]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+
+    pivot = arr[mid]
+    arr[mid], arr[high] = arr[high], arr[mid]
+
+    i = low - 1
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+def introsort(arr, low, high):
+    """
+    Sorts arr[low..high] (inclusive) in place, with the same signature as
+    quick_sort/quicksort so the benchmark drivers can call it directly.
+
+    - Quicksort with an explicit stack instead of recursion. The larger side
+      is pushed and the smaller side is processed first, so the stack never
+      holds more than about log2(n) ranges.
+    - Once a range has been partitioned more than 2*log2(n) times, it is
+      finished with heapsort, so the worst case is O(n log n).
+    - Ranges of INSERTION_THRESHOLD elements or fewer use insertion sort.
+    """
+    if high - low < 1:
+        return
+    stack = [(low, high, 2 * int(math.log2(high - low + 1)))]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                heapsort(arr, low, high)
+                break
+            depth -= 1
+            p = partition(arr, low, high)
+            if p - low < high - p:
+                stack.append((p + 1, high, depth))
+                high = p - 1
+            else:
+                stack.append((low, p - 1, depth))
+                low = p + 1
+        else:
+            insertion_sort(arr, low, high)
@@ -0,0 +1,127 @@
+# Bereket Gebremariam
+# Bottom-up natural merge sort with a single reusable buffer
+
+from bisect import bisect_left, bisect_right
+
+# Natural runs shorter than this are extended with insertion sort first
+MIN_RUN = 32
+# Consecutive wins by one side before a merge switches to galloping
+MIN_GALLOP = 7
+
+def _find_runs(arr):
+    """
+    Split arr into ascending runs and return their boundaries [0, ..., n].
+    Strictly descending runs are reversed in place (strict, so reversing
+    never reorders equal keys). Short runs are extended to MIN_RUN elements
+    with insertion sort.
+    """
+    n = len(arr)
+    bounds = [0]
+    start = 0
+    while start < n:
+        end = start + 1
+        if end < n and arr[end] < arr[start]:
+            while end < n and arr[end] < arr[end - 1]:
+                end += 1
+            lo, hi = start, end - 1
+            while lo < hi:
+                arr[lo], arr[hi] = arr[hi], arr[lo]
+                lo += 1
+                hi -= 1
+        else:
+            while end < n and arr[end] >= arr[end - 1]:
+                end += 1
+        if end - start < MIN_RUN and end < n:
+            stop = min(start + MIN_RUN, n)
+            for i in range(end, stop):
+                key = arr[i]
+                j = i - 1
+                while j >= start and arr[j] > key:
+                    arr[j + 1] = arr[j]
+                    j -= 1
+                arr[j + 1] = key
+            end = stop
+        bounds.append(end)
+        start = end
+    return bounds
+
+def _merge(src, lo, mid, hi, dst, gallop):
+    """Stable merge of src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            right_wins += 1
+            left_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            left_wins += 1
+            right_wins = 0
+        k += 1
+        if gallop and (left_wins >= MIN_GALLOP or right_wins >= MIN_GALLOP):
+            # One side keeps winning: binary-search how far it wins and
+            # copy that whole block without comparing element by element
+            if left_wins and j < hi:
+                stop = bisect_right(src, src[j], i, mid)
+                while i < stop:
+                    dst[k] = src[i]
+                    i += 1
+                    k += 1
+            elif right_wins and i < mid:
+                stop = bisect_left(src, src[i], j, hi)
+                while j < stop:
+                    dst[k] = src[j]
+                    j += 1
+                    k += 1
+            left_wins = right_wins = 0
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+def natural_merge_sort(arr, gallop=True):
+    """
+    Sorts arr in place (same call shape as merge_sort(arr)).
+
+    Iterative bottom-up merge sort over the natural runs already in the data,
+    so sorted and reverse-sorted input finish in one O(n) scan. Merging
+    alternates between arr and one n-slot buffer allocated up front instead
+    of slicing halves at every level, so extra memory stays at n slots.
+    gallop=True enables galloping when one run keeps winning.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    bounds = _find_runs(arr)
+    if len(bounds) == 2:
+        return  # already one run
+
+    buffer = [None] * n
+    src, dst = arr, buffer
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo = bounds[r]
+            if r + 2 < len(bounds):
+                mid, hi = bounds[r + 1], bounds[r + 2]
+                _merge(src, lo, mid, hi, dst, gallop)
+            else:
+                # Odd run out: carry it over to the other array unchanged
+                hi = bounds[r + 1]
+                for k in range(lo, hi):
+                    dst[k] = src[k]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    if src is not arr:
+        # Element-wise copy back: arr[:] = buffer would briefly hold a second
+        # n-slot array for the replaced items
+        for k in range(n):
+            arr[k] = buffer[k]
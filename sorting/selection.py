@@ -0,0 +1,71 @@
+# Bereket Gebremariam
+# Selection: introselect, partial sort and streaming top-k
+
+import heapq
+import math
+import random
+from .introsort import INSERTION_THRESHOLD, insertion_sort, introsort
+from .threeway import partition3
+
+def _median_of_medians(arr, low, high):
+    """BFPRT pivot for arr[low..high]: the exact median of the group-of-5 medians."""
+    medians = []
+    for start in range(low, high + 1, 5):
+        group = sorted(arr[start:min(start + 5, high + 1)])
+        medians.append(group[(len(group) - 1) // 2])
+    return _select(medians, 0, len(medians) - 1, len(medians) // 2)
+
+def _select(arr, low, high, k):
+    """Introselect on arr[low..high]; leaves arr[k] as the k-th smallest."""
+    # Random pivots (as in randomized_partition) until they stop paying off,
+    # then median-of-medians pivots for a guaranteed O(n) finish
+    random_rounds = 2 * max(int(math.log2(high - low + 1)), 1)
+    while high - low + 1 > INSERTION_THRESHOLD:
+        if random_rounds > 0:
+            random_rounds -= 1
+            pivot = arr[random.randint(low, high)]
+        else:
+            pivot = _median_of_medians(arr, low, high)
+        lt, gt = partition3(arr, low, high, pivot)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return arr[k]  # k landed among the keys equal to the pivot
+    insertion_sort(arr, low, high)
+    return arr[k]
+
+def quickselect(arr, k):
+    """
+    Returns the k-th smallest element of arr (k = 0 is the minimum) and
+    partially reorders arr in place so that arr[:k] <= arr[k] <= arr[k+1:].
+    Expected O(n) with random three-way partitions; switches to
+    median-of-medians pivots if they keep missing (introselect), so the
+    worst case is O(n) as well.
+    """
+    if not 0 <= k < len(arr):
+        raise IndexError("k out of range")
+    return _select(arr, 0, len(arr) - 1, k)
+
+def partial_sort(arr, k):
+    """
+    Puts the k smallest elements of arr, in sorted order, into arr[:k].
+    The rest of arr is left in arbitrary order. O(n + k log k).
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return
+    if k < len(arr):
+        quickselect(arr, k - 1)
+    introsort(arr, 0, k - 1)
+
+def top_k(iterable, k, largest=False):
+    """
+    The k smallest (or largest) items of any iterable, in sorted order.
+    Keeps a bounded heap of k items while consuming the iterable once, so a
+    generator is never materialized: O(n log k) time, O(k) memory.
+    """
+    if largest:
+        return heapq.nlargest(k, iterable)
+    return heapq.nsmallest(k, iterable)
@@ -0,0 +1,63 @@
+# Bereket Gebremariam
+# Three-way (Dutch national flag) quicksort for duplicate-heavy inputs
+
+import math
+from .introsort import INSERTION_THRESHOLD, heapsort, insertion_sort
+
+def partition3(arr, low, high, pivot=None):
+    """
+    Dutch national flag partition of arr[low..high] around a pivot value
+    (median-of-three if none is given), in one pass. Returns (lt, gt) such
+    that afterwards arr[low..lt-1] < pivot, arr[lt..gt] == pivot and
+    arr[gt+1..high] > pivot.
+    """
+    if pivot is None:
+        a, b, c = arr[low], arr[(low + high) // 2], arr[high]
+        if a > b:
+            a, b = b, a
+        if b > c:
+            b = a if a > c else c
+        pivot = b
+
+    lt, i, gt = low, low, high
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[lt], arr[i] = value, arr[lt]
+            lt += 1
+            i += 1
+        elif value > pivot:
+            arr[i], arr[gt] = arr[gt], value
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def quicksort_3way(arr, low, high):
+    """
+    Sorts arr[low..high] (inclusive) in place. Keys equal to the pivot are
+    grouped in the middle and never visited again, so inputs with only a
+    few hundred distinct values sort in close to O(n * distinct) time
+    instead of degrading like a two-way Lomuto partition.
+    Same explicit stack, heapsort fallback and insertion-sort cutoff as
+    introsort.
+    """
+    if high - low < 1:
+        return
+    stack = [(low, high, 2 * int(math.log2(high - low + 1)))]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low + 1 > INSERTION_THRESHOLD:
+            if depth == 0:
+                heapsort(arr, low, high)
+                break
+            depth -= 1
+            lt, gt = partition3(arr, low, high)
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        else:
+            insertion_sort(arr, low, high)
@@ -0,0 +1,124 @@
+# Bereket Gebremariam
+# NumPy-vectorized sort backend for typed numeric arrays
+
+import array
+import math
+import numpy as np
+
+# Segments this small are finished with one contiguous in-C sort
+BLOCK_SIZE = 4096
+# Bounded integer keys with a value range up to this many times n use a
+# single counting pass instead of LSD radix passes
+COUNTING_RANGE_FACTOR = 4
+RADIX_BITS = 16
+
+def as_ndarray(arr):
+    """
+    View a NumPy array or array.array as an ndarray sharing the same memory,
+    so sorting it sorts the caller's data in place. Python lists are
+    rejected rather than silently copied.
+    """
+    if isinstance(arr, np.ndarray):
+        return arr
+    if isinstance(arr, array.array):
+        return np.asarray(memoryview(arr))
+    raise TypeError("expected a NumPy array or array.array, not " + type(arr).__name__)
+
+def _move_nans_last(a, low, high):
+    """Move NaNs to the end of a[low..high]; return the new high of the non-NaN part."""
+    seg = a[low:high + 1]
+    nan = np.isnan(seg)
+    count = int(np.count_nonzero(nan))
+    if count:
+        values = seg[~nan]
+        seg[:len(values)] = values
+        seg[len(values):] = np.nan
+    return high - count
+
+def vectorized_quicksort(arr, low=0, high=None):
+    """
+    Sorts arr[low..high] (inclusive) in place, where arr is a NumPy array or
+    array.array. Each partition step is a three-way split done with boolean
+    masks over the whole segment (< pivot, == pivot, > pivot), so Python
+    only runs once per partition, not once per element. Segments of
+    BLOCK_SIZE or fewer, and any segment past the 2*log2(n) depth limit,
+    are finished with ndarray.sort on that contiguous block.
+    NaNs are placed last, as np.sort does.
+    """
+    a = as_ndarray(arr)
+    if high is None:
+        high = len(a) - 1
+    if high - low < 1:
+        return
+    if a.dtype.kind == "f":
+        high = _move_nans_last(a, low, high)
+
+    stack = [(low, high + 1, 2 * int(math.log2(high - low + 1)))]  # half-open ranges
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > BLOCK_SIZE and depth > 0:
+            depth -= 1
+            seg = a[lo:hi]
+            pivot = sorted((seg[0], seg[len(seg) // 2], seg[-1]))[1]
+            less = seg < pivot
+            greater = seg > pivot
+            smaller, larger = seg[less], seg[greater]
+            equal = seg[~(less | greater)]
+            n_less, n_equal = len(smaller), len(equal)
+            seg[:n_less] = smaller
+            seg[n_less:n_less + n_equal] = equal
+            seg[n_less + n_equal:] = larger
+            left = (lo, lo + n_less)
+            right = (lo + n_less + n_equal, hi)
+            if n_less < hi - right[0]:
+                stack.append((right[0], right[1], depth))
+                lo, hi = left
+            else:
+                stack.append((left[0], left[1], depth))
+                lo, hi = right
+        if hi - lo > 1:
+            a[lo:hi].sort(kind="heapsort" if hi - lo > BLOCK_SIZE else "quicksort")
+
+def radix_sort(arr, low=0, high=None):
+    """
+    Sorts integer keys in arr[low..high] (inclusive) in place.
+
+    When the value range is at most COUNTING_RANGE_FACTOR * n (the
+    randint(0, n) workloads), one vectorized counting pass (bincount +
+    repeat) does the whole sort in O(n + range). Otherwise an LSD radix sort
+    runs over RADIX_BITS-bit digits of the key offset by the minimum, with
+    one stable pass per digit.
+    """
+    a = as_ndarray(arr)
+    if a.dtype.kind not in "iu":
+        raise TypeError("radix_sort requires integer keys")
+    if high is None:
+        high = len(a) - 1
+    seg = a[low:high + 1]
+    n = len(seg)
+    if n < 2:
+        return
+    min_value, max_value = int(seg.min()), int(seg.max())
+    span = max_value - min_value
+
+    if span <= max(COUNTING_RANGE_FACTOR * n, 1 << RADIX_BITS):
+        # Offsets are taken in the key's own width and reinterpreted as
+        # unsigned: seg - min_value can wrap for signed input spanning the
+        # dtype (int8 127 - -128), but the true offset is < 2**bits, so the
+        # unsigned view is exact for every integer dtype, uint64 included.
+        base = seg.dtype.type(min_value)
+        offsets = (seg - base).view(f"u{seg.dtype.itemsize}")
+        counts = np.bincount(offsets.astype(np.intp), minlength=span + 1)
+        values = np.arange(span + 1).astype(seg.dtype)
+        values += base  # same wraparound, back into the key range
+        seg[:] = np.repeat(values, counts)
+        return
+
+    # Offset keys are non-negative and fit in 64 bits even for signed input
+    offset = np.uint64(min_value % (1 << 64))
+    keys = seg.astype(np.int64).astype(np.uint64) - offset
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in range(0, span.bit_length(), RADIX_BITS):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(np.uint16)
+        keys = keys[np.argsort(digits, kind="stable")]  # stable 16-bit pass
+    seg[:] = (keys + offset).astype(np.int64).astype(seg.dtype)